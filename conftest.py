@@ -0,0 +1,72 @@
+"""
+Shared fixtures for the live-server MCP compliance suite (test_mcp_compliance.py).
+
+The HTTP client and the baseline initialize handshake are session-scoped, so
+every test class (and, under pytest-xdist, every worker) warms them up once.
+"""
+
+import time
+
+import httpx
+import pytest
+
+from mcp_test_config import API_BASE_URL, MCP_ENDPOINT, POOL_SIZE, PROBE_BACKOFF, TIMEOUT
+
+
+@pytest.fixture(scope="session")
+def mcp_client():
+    """Pooled, HTTP/2-capable client, checked against the running server"""
+    # With HTTP/2 the concurrent tests multiplex over a single connection;
+    # servers that only speak HTTP/1.1 fall back to the keep-alive pool.
+    # Redirects are followed so MCP_ENDPOINT reaches the router's /mcp/ route.
+    client = httpx.Client(
+        http2=True,
+        base_url=API_BASE_URL,
+        follow_redirects=True,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE)
+    )
+
+    # Bounded exponential backoff so a server that is still starting up
+    # (or several xdist workers hitting it at once) doesn't fail the run
+    for delay in PROBE_BACKOFF:
+        try:
+            response = client.get("/", timeout=1.0)
+            if response.is_success:
+                break
+        except httpx.HTTPError:
+            pass
+        time.sleep(delay)
+    else:
+        client.close()
+        pytest.skip(f"MCP server not reachable at {API_BASE_URL} - "
+                    "make sure the FastAPI app is running: python run_fastapi.py")
+
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def baseline_init(mcp_client):
+    """Session-wide initialize + initialized handshake; returns the initialize result"""
+    response = mcp_client.post(MCP_ENDPOINT, json={
+        "jsonrpc": "2.0",
+        "method": "initialize",
+        "id": 1,
+        "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {
+                "tools": {},
+                "resources": {},
+                "prompts": {},
+                "logging": {}
+            },
+            "clientInfo": {"name": "mcp-compliance-baseline", "version": "1.0.0"}
+        }
+    })
+    if not response.is_success:
+        pytest.fail(f"initialize at {MCP_ENDPOINT} returned HTTP {response.status_code}, expected 2xx")
+    result = response.json().get('result')
+    if result is not None:
+        mcp_client.post(MCP_ENDPOINT, json={"jsonrpc": "2.0", "method": "initialized", "id": 2})
+    return result
@@ -5,11 +5,11 @@ Sets up SQLAlchemy async engine and session management following FastAPI pattern
 """
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
 from typing import AsyncGenerator
 import os
 
 from config import settings
+from models.database import Base
 
 # Create async engine
 engine = create_async_engine(
@@ -25,10 +25,6 @@ async_session = async_sessionmaker(
     expire_on_commit=False
 )
 
-# Create declarative base
-Base = declarative_base()
-
-
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency function that yields database sessions.
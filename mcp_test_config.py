@@ -0,0 +1,12 @@
+"""
+Connection settings for the live-server MCP compliance suite.
+
+Shared by conftest.py (session fixtures) and test_mcp_compliance.py.
+"""
+
+# Configuration
+API_BASE_URL = "http://127.0.0.1:5001"
+TIMEOUT = 10  # seconds
+MCP_ENDPOINT = f"{API_BASE_URL}/mcp"
+POOL_SIZE = 32  # keep-alive connections shared by all tests
+PROBE_BACKOFF = (0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0, 1.0)  # seconds between reachability probes
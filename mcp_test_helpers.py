@@ -0,0 +1,45 @@
+"""
+JSON codec and JSON-RPC response validators shared by the MCP test suites
+(test_mcp_compliance.py and tests/test_mcp_protocol.py).
+"""
+
+import json
+from typing import Any
+
+import fastjsonschema
+import pytest
+
+try:
+    import orjson
+    dumps, loads = orjson.dumps, orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
+    loads = json.loads
+
+# JSON-RPC 2.0 response envelopes, compiled once
+VALIDATE_RPC_OK = fastjsonschema.compile({
+    "type": "object",
+    "required": ["jsonrpc", "id", "result"],
+    "properties": {"jsonrpc": {"const": "2.0"}}
+})
+VALIDATE_RPC_ERR = fastjsonschema.compile({
+    "type": "object",
+    "required": ["jsonrpc", "error"],
+    "properties": {
+        "jsonrpc": {"const": "2.0"},
+        "error": {
+            "type": "object",
+            "required": ["code", "message"],
+            "properties": {"code": {"type": "integer"}, "message": {"type": "string"}}
+        }
+    }
+})
+
+
+def check_schema(validate, data):
+    """Run a compiled validator, turning a schema violation into a test failure."""
+    try:
+        validate(data)
+    except fastjsonschema.JsonSchemaValueException as e:
+        pytest.fail(f"{e.message}: {data!r}")
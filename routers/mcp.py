@@ -5,9 +5,9 @@ FastAPI router implementing JSON-RPC 2.0 MCP endpoints for tool execution,
 resource access, and prompt management.
 """
 
-from typing import Any, Dict
-from fastapi import APIRouter, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from typing import Any, Dict, Tuple
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
 from dependencies import DatabaseDep
 from schemas import (
@@ -27,6 +27,9 @@ router = APIRouter(prefix="/mcp", tags=["mcp"])
 # Current logging level (in-memory for demonstration)
 current_log_level = "info"
 
+# Largest JSON-RPC batch accepted in one POST; its messages run one after another
+MAX_BATCH_SIZE = 100
+
 
 def create_mcp_error_response(request_id: Any, code: int, message: str, data: Any = None) -> Dict[str, Any]:
     """Create a standard MCP error response."""
@@ -56,87 +59,127 @@ async def mcp_server(request: Request, db: DatabaseDep):
     Full MCP server implementation using JSON-RPC 2.0 protocol.
     
     Handles all MCP methods including initialize, tools, resources, prompts, and logging.
-    Follows the MCP specification October 2025.
+    Follows the MCP specification October 2025. Also accepts JSON-RPC 2.0
+    batches (an array of messages), which MCP revisions before 2025-06-18
+    allowed: the reply is an array with one response per request, in order.
+    Notifications get no response, and a batch of only notifications is
+    answered with 204 No Content. Batches longer than MAX_BATCH_SIZE are
+    rejected as a whole. Errors are reported inside each response,
+    so a batch that was read is always answered with 200.
     """
     try:
         # Parse the JSON-RPC request
         body = await request.json()
-        
-        # Validate basic JSON-RPC structure
-        if not isinstance(body, dict) or body.get("jsonrpc") != "2.0":
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content=create_mcp_error_response(
-                    body.get("id"), -32600, "Invalid Request"
-                )
-            )
-        
-        method = body.get("method")
-        params = body.get("params", {})
-        request_id = body.get("id")
-        
-        if not method:
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content=create_mcp_error_response(request_id, -32600, "Missing method")
-            )
-        
-        # Route to appropriate handler
-        try:
-            if method == "initialize":
-                result = await handle_mcp_initialize(params)
-            elif method == "initialized":
-                result = await handle_mcp_initialized(params)
-            elif method == "tools/list":
-                result = await handle_mcp_tools_list(params)
-            elif method == "tools/call":
-                result = await handle_mcp_tools_call(params, db)
-            elif method == "resources/list":
-                result = await handle_mcp_resources_list(params)
-            elif method == "resources/read":
-                result = await handle_mcp_resources_read(params)
-            elif method == "resources/subscribe":
-                result = await handle_mcp_resources_subscribe(params)
-            elif method == "prompts/list":
-                result = await handle_mcp_prompts_list(params)
-            elif method == "prompts/get":
-                result = await handle_mcp_prompts_get(params)
-            elif method == "logging/setLevel":
-                result = await handle_mcp_logging_setLevel(params)
-            else:
-                return JSONResponse(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    content=create_mcp_error_response(
-                        request_id, -32601, f"Method not found: {method}"
-                    )
-                )
-            
-            return JSONResponse(
-                content=create_mcp_success_response(request_id, result)
-            )
-            
-        except ValueError as e:
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content=create_mcp_error_response(
-                    request_id, -32602, f"Invalid params: {str(e)}"
-                )
-            )
-        except Exception as e:
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content=create_mcp_error_response(
-                    request_id, -32603, f"Internal error: {str(e)}"
-                )
-            )
-            
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
             content=create_mcp_error_response(
                 None, -32700, f"Parse error: {str(e)}"
             )
         )
+    
+    if not isinstance(body, list):
+        status_code, content = await dispatch_mcp_message(body, db)
+        return ORJSONResponse(status_code=status_code, content=content)
+    
+    # An empty batch is itself an invalid request
+    if not body:
+        return ORJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=create_mcp_error_response(None, -32600, "Invalid Request: empty batch")
+        )
+    
+    if len(body) > MAX_BATCH_SIZE:
+        return ORJSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content=create_mcp_error_response(
+                None, -32600, f"Invalid Request: batch exceeds {MAX_BATCH_SIZE} messages"
+            )
+        )
+    
+    # Messages share one database session, so they are handled in order
+    responses = []
+    for message in body:
+        _, content = await dispatch_mcp_message(message, db)
+        if not is_mcp_notification(message):
+            responses.append(content)
+    
+    if not responses:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    return ORJSONResponse(content=responses)
+
+
+def is_mcp_notification(message: Any) -> bool:
+    """Return True for a well-formed JSON-RPC notification (a request without an id)."""
+    return (
+        isinstance(message, dict)
+        and message.get("jsonrpc") == "2.0"
+        and isinstance(message.get("method"), str)
+        and bool(message["method"])
+        and "id" not in message
+    )
+
+
+async def dispatch_mcp_message(message: Any, db) -> Tuple[int, Dict[str, Any]]:
+    """
+    Validate and route a single JSON-RPC message.
+    
+    Returns the HTTP status code and response body for the message.
+    """
+    # Validate basic JSON-RPC structure
+    if not isinstance(message, dict) or message.get("jsonrpc") != "2.0":
+        request_id = message.get("id") if isinstance(message, dict) else None
+        return status.HTTP_400_BAD_REQUEST, create_mcp_error_response(
+            request_id, -32600, "Invalid Request"
+        )
+    
+    method = message.get("method")
+    params = message.get("params", {})
+    request_id = message.get("id")
+    
+    if not method:
+        return status.HTTP_400_BAD_REQUEST, create_mcp_error_response(
+            request_id, -32600, "Missing method"
+        )
+    
+    # Route to appropriate handler
+    try:
+        if method == "initialize":
+            result = await handle_mcp_initialize(params)
+        elif method == "initialized":
+            result = await handle_mcp_initialized(params)
+        elif method == "tools/list":
+            result = await handle_mcp_tools_list(params)
+        elif method == "tools/call":
+            result = await handle_mcp_tools_call(params, db)
+        elif method == "resources/list":
+            result = await handle_mcp_resources_list(params)
+        elif method == "resources/read":
+            result = await handle_mcp_resources_read(params)
+        elif method == "resources/subscribe":
+            result = await handle_mcp_resources_subscribe(params)
+        elif method == "prompts/list":
+            result = await handle_mcp_prompts_list(params)
+        elif method == "prompts/get":
+            result = await handle_mcp_prompts_get(params)
+        elif method == "logging/setLevel":
+            result = await handle_mcp_logging_setLevel(params)
+        else:
+            return status.HTTP_404_NOT_FOUND, create_mcp_error_response(
+                request_id, -32601, f"Method not found: {method}"
+            )
+        
+        return status.HTTP_200_OK, create_mcp_success_response(request_id, result)
+        
+    except ValueError as e:
+        return status.HTTP_400_BAD_REQUEST, create_mcp_error_response(
+            request_id, -32602, f"Invalid params: {str(e)}"
+        )
+    except Exception as e:
+        return status.HTTP_500_INTERNAL_SERVER_ERROR, create_mcp_error_response(
+            request_id, -32603, f"Internal error: {str(e)}"
+        )
 
 
 async def handle_mcp_initialize(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -58,6 +58,88 @@ async def get_pets_summary(db: DatabaseDep):
     return PetSummary(**summary)
 
 
+# Fixed paths are registered before /{pet_id}, which would otherwise match
+# them and reject the segment as an invalid pet id (422)
+@router.put("/adopt", response_model=AdoptionResponse)
+async def adopt_pet_by_name(
+    name: str = Query(..., description="Pet name to search for"),
+    db: DatabaseDep = None
+):
+    """
+    Mark a pet as adopted by searching for its name.
+    
+    Finds a pet by name (case-insensitive) and marks it as adopted.
+    """
+    pet = await PetService.find_pet_by_name(db, name)
+    if not pet:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f'No pet found with name containing "{name}"'
+        )
+    
+    try:
+        adopted_pet = await PetService.adopt_pet(db, pet.id)
+        return AdoptionResponse(
+            message=f"{adopted_pet.name} has been successfully adopted!",
+            pet=adopted_pet
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/search", response_model=List[Pet])
+async def search_pets(
+    species: Optional[str] = Query(None, description="Filter by species"),
+    breed: Optional[str] = Query(None, description="Filter by breed"),
+    available_only: bool = Query(False, description="Only available pets"),
+    min_age: Optional[int] = Query(None, ge=0, description="Minimum age"),
+    max_age: Optional[int] = Query(None, le=50, description="Maximum age"),
+    db: DatabaseDep = None
+):
+    """
+    Search pets with various filters.
+    
+    Supports filtering by species, breed, availability, and age range.
+    """
+    pets = await PetService.search_pets(
+        db, 
+        species=species,
+        breed=breed, 
+        available_only=available_only,
+        min_age=min_age,
+        max_age=max_age
+    )
+    return pets
+
+
+@router.get("/available", response_model=List[Pet])
+async def get_available_pets(db: DatabaseDep):
+    """
+    Get all pets that are currently available for adoption.
+    
+    Returns only pets that have not yet been adopted.
+    """
+    pets = await PetService.get_available_pets(db)
+    return pets
+
+
+
+
+@router.get("/species", response_model=dict)
+async def get_valid_species(db: DatabaseDep):
+    """
+    Get list of valid/common pet species.
+    
+    Returns both existing species in the database and common pet species options.
+    """
+    from services import MCPService
+    result = await MCPService._execute_get_valid_species(db)
+    return result
+
+
 @router.get("/{pet_id}", response_model=Pet)
 async def get_pet(pet_id: int, db: DatabaseDep):
     """
@@ -131,72 +213,6 @@ async def adopt_pet(pet_id: int, db: DatabaseDep):
         )
 
 
-@router.put("/adopt", response_model=AdoptionResponse)
-async def adopt_pet_by_name(
-    name: str = Query(..., description="Pet name to search for"),
-    db: DatabaseDep = None
-):
-    """
-    Mark a pet as adopted by searching for its name.
-    
-    Finds a pet by name (case-insensitive) and marks it as adopted.
-    """
-    pet = await PetService.find_pet_by_name(db, name)
-    if not pet:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f'No pet found with name containing "{name}"'
-        )
-    
-    try:
-        adopted_pet = await PetService.adopt_pet(db, pet.id)
-        return AdoptionResponse(
-            message=f"{adopted_pet.name} has been successfully adopted!",
-            pet=adopted_pet
-        )
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-
-
-@router.get("/search", response_model=List[Pet])
-async def search_pets(
-    species: Optional[str] = Query(None, description="Filter by species"),
-    breed: Optional[str] = Query(None, description="Filter by breed"),
-    available_only: bool = Query(False, description="Only available pets"),
-    min_age: Optional[int] = Query(None, ge=0, description="Minimum age"),
-    max_age: Optional[int] = Query(None, le=50, description="Maximum age"),
-    db: DatabaseDep = None
-):
-    """
-    Search pets with various filters.
-    
-    Supports filtering by species, breed, availability, and age range.
-    """
-    pets = await PetService.search_pets(
-        db, 
-        species=species,
-        breed=breed, 
-        available_only=available_only,
-        min_age=min_age,
-        max_age=max_age
-    )
-    return pets
-
-
-@router.get("/available", response_model=List[Pet])
-async def get_available_pets(db: DatabaseDep):
-    """
-    Get all pets that are currently available for adoption.
-    
-    Returns only pets that have not yet been adopted.
-    """
-    pets = await PetService.get_available_pets(db)
-    return pets
-
-
 @router.post("/batch", response_model=BatchPetCreateResponse, status_code=status.HTTP_201_CREATED)
 async def create_multiple_pets(batch_data: BatchPetCreate, db: DatabaseDep):
     """
@@ -235,15 +251,3 @@ async def create_multiple_pets(batch_data: BatchPetCreate, db: DatabaseDep):
         created_pets=created_pets,
         errors=None
     )
-
-
-@router.get("/species", response_model=dict)
-async def get_valid_species(db: DatabaseDep):
-    """
-    Get list of valid/common pet species.
-    
-    Returns both existing species in the database and common pet species options.
-    """
-    from services import MCPService
-    result = await MCPService._execute_get_valid_species(db)
-    return result
@@ -7,6 +7,7 @@ Comprehensive test runner with multiple test categories and reporting options.
 
 import os
 import sys
+import json
 import subprocess
 import argparse
 from pathlib import Path
@@ -98,6 +99,8 @@ def run_mcp_tests():
 
 def run_performance_tests():
     """Run performance tests."""
+    # Always serial: throughput floors measured while xdist workers compete
+    # for the CPU say nothing about the app
     return run_command([
         "python", "-m", "pytest",
         "tests/test_performance.py",
@@ -121,13 +124,16 @@ def run_validation_tests():
     return all(results)
 
 
-def run_all_tests():
-    """Run all test suites."""
-    return run_command([
+def run_all_tests(parallel=False):
+    """Run all test suites, optionally spread across CPUs with pytest-xdist."""
+    cmd = [
         "python", "-m", "pytest",
         "tests/",
         "-v", "--tb=short"
-    ], "All Test Suites")
+    ]
+    if parallel:
+        cmd += ["-n", "auto"]
+    return run_command(cmd, "All Test Suites")
 
 
 def run_with_coverage():
@@ -163,8 +169,15 @@ def main():
     parser.add_argument("--markers", nargs="+", help="Specific pytest markers to run")
     parser.add_argument("--skip-deps", action="store_true", help="Skip dependency check")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument("--parallel", "-n", action="store_true",
+                        help="Run the all category in parallel with pytest-xdist (-n auto); "
+                             "its performance tests then share the CPU, so loosen their "
+                             "throughput floors with PERF_FLOOR_RPS_<NAME> if needed")
     
     args = parser.parse_args()
+    if args.parallel and args.category == "performance":
+        parser.error("--parallel is not supported for the performance category: "
+                     "throughput floors need the CPU to themselves")
     
     print("🚀 FastAPI Pet Adoption API Test Runner")
     print("=" * 50)
@@ -194,20 +207,15 @@ def main():
     elif args.category == "coverage":
         success = run_with_coverage()
     elif args.category == "all":
-        success = run_all_tests()
+        success = run_all_tests(parallel=args.parallel)
     
-    print("\n" + "=" * 50)
-    if success:
-        print("🎉 All tests completed successfully!")
-        print("\n📊 Test Summary:")
-        print("  • FastAPI application fully tested")
-        print("  • All endpoints validated")
-        print("  • MCP protocol compliance verified")
-        print("  • Performance benchmarks met")
-        print("  • Ready for production deployment")
-    else:
-        print("❌ Some tests failed!")
-        print("Please check the output above for details.")
+    # Single machine-readable line so callers don't have to re-read a banner
+    print(json.dumps({
+        "ok": success,
+        "category": args.category,
+        "markers": args.markers
+    }))
+    if not success:
         sys.exit(1)
 
 
@@ -4,7 +4,7 @@ MCP (Model Context Protocol) Pydantic schemas for Pet Adoption API
 JSON-RPC 2.0 protocol schemas following MCP specification October 2025.
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from typing import Any, Dict, List, Optional, Union
 from enum import Enum
 
@@ -164,6 +164,8 @@ class MCPToolSchema(BaseModel):
 
 class MCPTool(BaseModel):
     """MCP tool definition schema."""
+    model_config = ConfigDict(defer_build=True)
+    
     name: str = Field(
         ...,
         description="Tool name",
@@ -246,6 +248,8 @@ class MCPToolCallResult(BaseModel):
 # Resources Method Schemas
 class MCPResource(BaseModel):
     """MCP resource definition."""
+    model_config = ConfigDict(defer_build=True)
+    
     uri: str = Field(
         ...,
         description="Resource URI",
@@ -299,6 +303,8 @@ class MCPPromptArgument(BaseModel):
 
 class MCPPrompt(BaseModel):
     """MCP prompt template definition."""
+    model_config = ConfigDict(defer_build=True)
+    
     name: str = Field(
         ...,
         description="Prompt name",
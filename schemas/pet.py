@@ -104,7 +104,8 @@ class PetCreate(PetBase):
     Inherits all validation from PetBase and is used for POST /pets requests.
     All required fields must be provided.
     """
-    pass
+    # Core schema is built on first validation rather than at import
+    model_config = ConfigDict(defer_build=True)
 
 
 class PetUpdate(BaseModel):
@@ -113,6 +114,8 @@ class PetUpdate(BaseModel):
     
     All fields are optional to allow partial updates via PATCH/PUT operations.
     """
+    model_config = ConfigDict(defer_build=True)
+    
     name: Optional[str] = Field(
         None, 
         min_length=1, 
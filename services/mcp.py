@@ -4,16 +4,719 @@ MCP (Model Context Protocol) service for Pet Adoption API
 Async service for MCP tool execution, resource management, and prompt handling.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
 from models import Pet
 from schemas import PetCreate, PetUpdate, MCPContent, MCPTool, MCPResource, MCPPrompt
+from schemas.mcp import MCPToolSchema, MCPPromptArgument
 from services.pet import PetService
 from services.stats import StatsService
 
 
+# Static MCP definitions. They are built once at import and returned as-is by
+# MCPService.get_available_*, so callers must treat them as read-only.
+# The data is authored here, so the models are built with model_construct
+# (no validation); the helpers below construct the nested models too.
+
+def _tool(**fields: Any) -> MCPTool:
+    """Build a trusted MCPTool without validation."""
+    for key in ("inputSchema", "outputSchema"):
+        if fields.get(key) is not None:
+            fields[key] = MCPToolSchema.model_construct(**fields[key])
+    return MCPTool.model_construct(**fields)
+
+
+def _prompt(**fields: Any) -> MCPPrompt:
+    """Build a trusted MCPPrompt without validation."""
+    if fields.get("arguments") is not None:
+        fields["arguments"] = [MCPPromptArgument.model_construct(**arg) for arg in fields["arguments"]]
+    return MCPPrompt.model_construct(**fields)
+
+
+_TOOLS: Tuple[MCPTool, ...] = (
+    _tool(
+        name="get_pets_summary",
+        title="Get Pets Summary",
+        description="Get comprehensive pet statistics by species and adoption status",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "summary_by_species": {
+                    "type": "object",
+                    "description": "Statistics grouped by pet species",
+                    "additionalProperties": {
+                        "type": "object",
+                        "properties": {
+                            "total": {"type": "integer"},
+                            "adopted": {"type": "integer"},
+                            "available": {"type": "integer"}
+                        }
+                    }
+                },
+                "overall_totals": {
+                    "type": "object",
+                    "description": "Overall adoption statistics",
+                    "properties": {
+                        "total_pets": {"type": "integer"},
+                        "adopted_pets": {"type": "integer"},
+                        "available_pets": {"type": "integer"},
+                        "adoption_rate": {"type": "number"}
+                    }
+                }
+            },
+            "required": ["summary_by_species", "overall_totals"],
+            "additionalProperties": False
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.9,
+            "category": "analytics",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="search_pets",
+        title="Search Pets",
+        description="Search pets with optional filters for species, breed, availability, and age",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "species": {
+                    "type": "string",
+                    "description": "Filter by species",
+                    "examples": ["Dog", "Cat", "Bird"]
+                },
+                "breed": {
+                    "type": "string",
+                    "description": "Filter by breed"
+                },
+                "available_only": {
+                    "type": "boolean",
+                    "description": "Only available pets",
+                    "default": False
+                },
+                "min_age": {
+                    "type": "integer",
+                    "description": "Minimum age",
+                    "minimum": 0
+                },
+                "max_age": {
+                    "type": "integer",
+                    "description": "Maximum age",
+                    "minimum": 0
+                }
+            },
+            "required": [],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "species": {"type": "string"},
+                    "breed": {"type": "string"},
+                    "age": {"type": "integer"},
+                    "description": {"type": "string"},
+                    "is_adopted": {"type": "boolean"},
+                    "created_at": {"type": "string", "format": "date-time"},
+                    "updated_at": {"type": "string", "format": "date-time"}
+                },
+                "required": ["id", "name", "species", "is_adopted"]
+            }
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.8,
+            "category": "search",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="create_pet",
+        title="Create Pet",
+        description="Add a new pet to the adoption system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Pet name",
+                    "minLength": 1,
+                    "maxLength": 100
+                },
+                "species": {
+                    "type": "string",
+                    "description": "Pet species",
+                    "enum": ["Dog", "Cat", "Bird", "Rabbit", "Hamster", "Guinea Pig", "Fish", "Reptile"]
+                },
+                "breed": {
+                    "type": "string",
+                    "description": "Pet breed (optional)",
+                    "maxLength": 100
+                },
+                "age": {
+                    "type": "integer",
+                    "description": "Pet age (optional)",
+                    "minimum": 0,
+                    "maximum": 30
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Pet description (optional)",
+                    "maxLength": 500
+                }
+            },
+            "required": ["name", "species"],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "species": {"type": "string"},
+                "breed": {"type": "string"},
+                "age": {"type": "integer"},
+                "description": {"type": "string"},
+                "is_adopted": {"type": "boolean"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "updated_at": {"type": "string", "format": "date-time"}
+            },
+            "required": ["id", "name", "species", "is_adopted", "created_at"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.7,
+            "category": "modification",
+            "requiresConfirmation": True,
+            "sensitiveOperation": True
+        }
+    ),
+    _tool(
+        name="adopt_pet_by_name",
+        title="Adopt Pet by Name",
+        description="Mark a pet as adopted by searching for its name",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Pet name to search for",
+                    "minLength": 1
+                }
+            },
+            "required": ["name"],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "message": {"type": "string"},
+                "pet_id": {"type": "integer"},
+                "pet_name": {"type": "string"},
+                "is_adopted": {"type": "boolean"}
+            },
+            "required": ["message", "pet_id", "pet_name", "is_adopted"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.8,
+            "category": "modification",
+            "requiresConfirmation": True,
+            "sensitiveOperation": True
+        }
+    ),
+    _tool(
+        name="update_pet_info",
+        title="Update Pet Information",
+        description="Update pet details like name, species, breed, age, or description",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pet_id": {
+                    "type": "integer",
+                    "description": "Pet ID to update",
+                    "minimum": 1
+                },
+                "name": {
+                    "type": "string",
+                    "description": "New pet name",
+                    "minLength": 1,
+                    "maxLength": 100
+                },
+                "species": {
+                    "type": "string",
+                    "description": "New pet species",
+                    "enum": ["Dog", "Cat", "Bird", "Rabbit", "Hamster", "Guinea Pig", "Fish", "Reptile"]
+                },
+                "breed": {
+                    "type": "string",
+                    "description": "New pet breed",
+                    "maxLength": 100
+                },
+                "age": {
+                    "type": "integer",
+                    "description": "New pet age",
+                    "minimum": 0,
+                    "maximum": 30
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New pet description",
+                    "maxLength": 500
+                }
+            },
+            "required": ["pet_id"],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "species": {"type": "string"},
+                "breed": {"type": "string"},
+                "age": {"type": "integer"},
+                "description": {"type": "string"},
+                "is_adopted": {"type": "boolean"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "updated_at": {"type": "string", "format": "date-time"}
+            },
+            "required": ["id", "name", "species", "is_adopted", "updated_at"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.7,
+            "category": "modification",
+            "requiresConfirmation": True,
+            "sensitiveOperation": True
+        }
+    ),
+    _tool(
+        name="get_valid_species",
+        title="Get Valid Pet Species",
+        description="Get list of valid pet species including existing and common options",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "species": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "All valid pet species"
+                },
+                "existing_in_database": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Species currently in database"
+                },
+                "common_options": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Common pet species options"
+                }
+            },
+            "required": ["species", "existing_in_database", "common_options"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.6,
+            "category": "reference",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="get_pet_by_name",
+        title="Get Pet by Name",
+        description="Find a pet by searching for its name",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {
+                    "type": "string",
+                    "description": "Pet name to search for",
+                    "minLength": 1
+                }
+            },
+            "required": ["name"],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "species": {"type": "string"},
+                "breed": {"type": "string"},
+                "age": {"type": "integer"},
+                "description": {"type": "string"},
+                "is_adopted": {"type": "boolean"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "updated_at": {"type": "string", "format": "date-time"}
+            },
+            "required": ["id", "name", "species", "is_adopted"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.8,
+            "category": "search",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="get_pet_by_id",
+        title="Get Pet by ID",
+        description="Get a specific pet by its ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pet_id": {
+                    "type": "integer",
+                    "description": "Pet ID to retrieve",
+                    "minimum": 1
+                }
+            },
+            "required": ["pet_id"],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "id": {"type": "integer"},
+                "name": {"type": "string"},
+                "species": {"type": "string"},
+                "breed": {"type": "string"},
+                "age": {"type": "integer"},
+                "description": {"type": "string"},
+                "is_adopted": {"type": "boolean"},
+                "created_at": {"type": "string", "format": "date-time"},
+                "updated_at": {"type": "string", "format": "date-time"}
+            },
+            "required": ["id", "name", "species", "is_adopted"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.8,
+            "category": "search",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="get_available_pets",
+        title="Get Available Pets",
+        description="Get all pets that are currently available for adoption",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "species": {"type": "string"},
+                    "breed": {"type": "string"},
+                    "age": {"type": "integer"},
+                    "description": {"type": "string"},
+                    "is_adopted": {"type": "boolean"},
+                    "created_at": {"type": "string", "format": "date-time"},
+                    "updated_at": {"type": "string", "format": "date-time"}
+                },
+                "required": ["id", "name", "species", "is_adopted"]
+            }
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.9,
+            "category": "search",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="get_adoption_stats",
+        title="Get Adoption Statistics",
+        description="Get overall adoption statistics including rates and counts",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "total_pets": {"type": "integer"},
+                "adopted_pets": {"type": "integer"},
+                "available_pets": {"type": "integer"},
+                "adoption_rate": {"type": "number"},
+                "species_breakdown": {
+                    "type": "object",
+                    "additionalProperties": {
+                        "type": "object",
+                        "properties": {
+                            "total": {"type": "integer"},
+                            "adopted": {"type": "integer"},
+                            "available": {"type": "integer"}
+                        }
+                    }
+                }
+            },
+            "required": ["total_pets", "adopted_pets", "available_pets", "adoption_rate"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.8,
+            "category": "analytics",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="list_all_pets",
+        title="List All Pets",
+        description="Get a complete list of all pets in the system",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+            "additionalProperties": False
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "pets": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "integer"},
+                            "name": {"type": "string"},
+                            "species": {"type": "string"},
+                            "breed": {"type": "string"},
+                            "age": {"type": "integer"},
+                            "description": {"type": "string"},
+                            "is_adopted": {"type": "boolean"},
+                            "created_at": {"type": "string", "format": "date-time"},
+                            "updated_at": {"type": "string", "format": "date-time"}
+                        },
+                        "required": ["id", "name", "species", "is_adopted"]
+                    }
+                },
+                "total_count": {"type": "integer"}
+            },
+            "required": ["pets", "total_count"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.7,
+            "category": "search",
+            "requiresConfirmation": False
+        }
+    ),
+    _tool(
+        name="delete_pet",
+        title="Delete Pet",
+        description="Remove a pet from the system by ID or name",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pet_id": {
+                    "type": "integer",
+                    "description": "Pet ID to delete",
+                    "minimum": 1
+                },
+                "pet_name": {
+                    "type": "string",
+                    "description": "Pet name to delete (alternative to pet_id)",
+                    "minLength": 1
+                }
+            },
+            "required": [],
+            "additionalProperties": False,
+            "anyOf": [
+                {"required": ["pet_id"]},
+                {"required": ["pet_name"]}
+            ]
+        },
+        outputSchema={
+            "type": "object",
+            "properties": {
+                "message": {"type": "string"},
+                "deleted_pet_id": {"type": "integer"}
+            },
+            "required": ["message", "deleted_pet_id"]
+        },
+        annotations={
+            "audience": ["user", "assistant"],
+            "priority": 0.6,
+            "category": "modification",
+            "requiresConfirmation": True,
+            "sensitiveOperation": True,
+            "destructiveOperation": True
+        }
+    )
+)
+
+
+_RESOURCES: Tuple[MCPResource, ...] = (
+    MCPResource.model_construct(
+        uri="file://adoption-form.pdf",
+        name="Pet Adoption Application Form",
+        description="Standard form for pet adoption applications",
+        mimeType="application/pdf"
+    ),
+    MCPResource.model_construct(
+        uri="file://pet-care-guide.md",
+        name="Pet Care Guidelines",
+        description="Comprehensive guide for pet care and responsibilities",
+        mimeType="text/markdown"
+    ),
+    MCPResource.model_construct(
+        uri="file://adoption-process.md",
+        name="Adoption Process Documentation",
+        description="Step-by-step guide to the pet adoption process",
+        mimeType="text/markdown"
+    ),
+    MCPResource.model_construct(
+        uri="file://species-info.json",
+        name="Pet Species Information",
+        description="Detailed information about different pet species and their care requirements",
+        mimeType="application/json"
+    )
+)
+
+
+_PROMPTS: Tuple[MCPPrompt, ...] = (
+    _prompt(
+        name="adoption_assistant",
+        description="AI assistant for pet adoption counseling and guidance",
+        arguments=[
+            {"name": "pet_type", "description": "Type of pet interested in", "required": False},
+            {"name": "experience_level", "description": "Pet owner experience level", "required": False}
+        ]
+    ),
+    _prompt(
+        name="pet_care_advisor",
+        description="Provide specific care advice for adopted pets",
+        arguments=[
+            {"name": "species", "description": "Pet species", "required": True},
+            {"name": "age", "description": "Pet age", "required": False},
+            {"name": "special_needs", "description": "Any special care requirements", "required": False}
+        ]
+    ),
+    _prompt(
+        name="species_recommender",
+        description="Recommend suitable pet species based on lifestyle and preferences",
+        arguments=[
+            {"name": "living_situation", "description": "Housing situation", "required": False},
+            {"name": "time_available", "description": "Time available for pet care", "required": False},
+            {"name": "experience", "description": "Previous pet experience", "required": False}
+        ]
+    )
+)
+
+
+def _adoption_assistant_messages(arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Messages for the adoption_assistant prompt."""
+    pet_type = arguments.get('pet_type', 'any pet')
+    experience = arguments.get('experience_level', 'beginner')
+
+    return [
+        {
+            "role": "system",
+            "content": {
+                "type": "text",
+                "text": f"You are a knowledgeable and compassionate pet adoption counselor. Help the user find the perfect {pet_type} companion based on their {experience} experience level. Provide personalized advice about pet care, responsibilities, and what to expect during the adoption process."
+            }
+        },
+        {
+            "role": "user",
+            "content": {
+                "type": "text",
+                "text": f"I'm interested in adopting {pet_type} and I consider myself a {experience} pet owner. Can you help guide me through the adoption process and what I should consider?"
+            }
+        }
+    ]
+
+
+def _pet_care_advisor_messages(arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Messages for the pet_care_advisor prompt."""
+    species = arguments.get('species', 'pet')
+    age = arguments.get('age')
+    special_needs = arguments.get('special_needs')
+
+    age_info = f" that is {age} years old" if age else ""
+    special_info = f" with special needs: {special_needs}" if special_needs else ""
+
+    return [
+        {
+            "role": "system", 
+            "content": {
+                "type": "text",
+                "text": f"You are an expert veterinarian and pet care specialist. Provide detailed, practical advice for caring for a {species}{age_info}{special_info}. Include information about feeding, exercise, health care, grooming, and any species-specific needs."
+            }
+        },
+        {
+            "role": "user",
+            "content": {
+                "type": "text",
+                "text": f"I just adopted a {species}{age_info}{special_info}. What specific care advice do you have for me to ensure my new pet is healthy and happy?"
+            }
+        }
+    ]
+
+
+def _species_recommender_messages(arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Messages for the species_recommender prompt."""
+    living_situation = arguments.get('living_situation', 'not specified')
+    time_available = arguments.get('time_available', 'moderate')
+    experience = arguments.get('experience', 'some')
+
+    return [
+        {
+            "role": "system",
+            "content": {
+                "type": "text", 
+                "text": "You are a pet adoption specialist who helps match people with the most suitable pet species based on their lifestyle, living situation, and experience. Consider factors like space requirements, time commitment, maintenance needs, and compatibility."
+            }
+        },
+        {
+            "role": "user",
+            "content": {
+                "type": "text",
+                "text": f"I live in a {living_situation} and have {time_available} time available for pet care. I have {experience} experience with pets. What species would you recommend for me and why?"
+            }
+        }
+    ]
+
+
+# Prompt name -> message builder, so get_prompt_content is a single dict lookup
+_PROMPT_BUILDERS: Dict[str, Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = {
+    "adoption_assistant": _adoption_assistant_messages,
+    "pet_care_advisor": _pet_care_advisor_messages,
+    "species_recommender": _species_recommender_messages,
+}
+
+
 class MCPService:
     """
     Async service for MCP protocol operations.
@@ -389,625 +1092,35 @@ class MCPService:
         }
 
     @staticmethod
-    def get_available_tools() -> List[MCPTool]:
+    def get_available_tools() -> Tuple[MCPTool, ...]:
         """
         Get list of all available MCP tools with enhanced MCP compliance.
         
         Returns:
-            List of MCPTool schemas describing available tools with annotations and output schemas
+            Tuple of MCPTool schemas describing available tools with annotations and output schemas.
+            Built once at import and shared by every caller, so treat it as read-only.
         """
-        return [
-            MCPTool(
-                name="get_pets_summary",
-                title="Get Pets Summary",
-                description="Get comprehensive pet statistics by species and adoption status",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "summary_by_species": {
-                            "type": "object",
-                            "description": "Statistics grouped by pet species",
-                            "additionalProperties": {
-                                "type": "object",
-                                "properties": {
-                                    "total": {"type": "integer"},
-                                    "adopted": {"type": "integer"},
-                                    "available": {"type": "integer"}
-                                }
-                            }
-                        },
-                        "overall_totals": {
-                            "type": "object",
-                            "description": "Overall adoption statistics",
-                            "properties": {
-                                "total_pets": {"type": "integer"},
-                                "adopted_pets": {"type": "integer"},
-                                "available_pets": {"type": "integer"},
-                                "adoption_rate": {"type": "number"}
-                            }
-                        }
-                    },
-                    "required": ["summary_by_species", "overall_totals"],
-                    "additionalProperties": False
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.9,
-                    "category": "analytics",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="search_pets",
-                title="Search Pets",
-                description="Search pets with optional filters for species, breed, availability, and age",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "species": {
-                            "type": "string",
-                            "description": "Filter by species",
-                            "examples": ["Dog", "Cat", "Bird"]
-                        },
-                        "breed": {
-                            "type": "string",
-                            "description": "Filter by breed"
-                        },
-                        "available_only": {
-                            "type": "boolean",
-                            "description": "Only available pets",
-                            "default": False
-                        },
-                        "min_age": {
-                            "type": "integer",
-                            "description": "Minimum age",
-                            "minimum": 0
-                        },
-                        "max_age": {
-                            "type": "integer",
-                            "description": "Maximum age",
-                            "minimum": 0
-                        }
-                    },
-                    "required": [],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "integer"},
-                            "name": {"type": "string"},
-                            "species": {"type": "string"},
-                            "breed": {"type": "string"},
-                            "age": {"type": "integer"},
-                            "description": {"type": "string"},
-                            "is_adopted": {"type": "boolean"},
-                            "created_at": {"type": "string", "format": "date-time"},
-                            "updated_at": {"type": "string", "format": "date-time"}
-                        },
-                        "required": ["id", "name", "species", "is_adopted"]
-                    }
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.8,
-                    "category": "search",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="create_pet",
-                title="Create Pet",
-                description="Add a new pet to the adoption system",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Pet name",
-                            "minLength": 1,
-                            "maxLength": 100
-                        },
-                        "species": {
-                            "type": "string",
-                            "description": "Pet species",
-                            "enum": ["Dog", "Cat", "Bird", "Rabbit", "Hamster", "Guinea Pig", "Fish", "Reptile"]
-                        },
-                        "breed": {
-                            "type": "string",
-                            "description": "Pet breed (optional)",
-                            "maxLength": 100
-                        },
-                        "age": {
-                            "type": "integer",
-                            "description": "Pet age (optional)",
-                            "minimum": 0,
-                            "maximum": 30
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Pet description (optional)",
-                            "maxLength": 500
-                        }
-                    },
-                    "required": ["name", "species"],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "integer"},
-                        "name": {"type": "string"},
-                        "species": {"type": "string"},
-                        "breed": {"type": "string"},
-                        "age": {"type": "integer"},
-                        "description": {"type": "string"},
-                        "is_adopted": {"type": "boolean"},
-                        "created_at": {"type": "string", "format": "date-time"},
-                        "updated_at": {"type": "string", "format": "date-time"}
-                    },
-                    "required": ["id", "name", "species", "is_adopted", "created_at"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.7,
-                    "category": "modification",
-                    "requiresConfirmation": True,
-                    "sensitiveOperation": True
-                }
-            ),
-            MCPTool(
-                name="adopt_pet_by_name",
-                title="Adopt Pet by Name",
-                description="Mark a pet as adopted by searching for its name",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Pet name to search for",
-                            "minLength": 1
-                        }
-                    },
-                    "required": ["name"],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "message": {"type": "string"},
-                        "pet_id": {"type": "integer"},
-                        "pet_name": {"type": "string"},
-                        "is_adopted": {"type": "boolean"}
-                    },
-                    "required": ["message", "pet_id", "pet_name", "is_adopted"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.8,
-                    "category": "modification",
-                    "requiresConfirmation": True,
-                    "sensitiveOperation": True
-                }
-            ),
-            MCPTool(
-                name="update_pet_info",
-                title="Update Pet Information",
-                description="Update pet details like name, species, breed, age, or description",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pet_id": {
-                            "type": "integer",
-                            "description": "Pet ID to update",
-                            "minimum": 1
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "New pet name",
-                            "minLength": 1,
-                            "maxLength": 100
-                        },
-                        "species": {
-                            "type": "string",
-                            "description": "New pet species",
-                            "enum": ["Dog", "Cat", "Bird", "Rabbit", "Hamster", "Guinea Pig", "Fish", "Reptile"]
-                        },
-                        "breed": {
-                            "type": "string",
-                            "description": "New pet breed",
-                            "maxLength": 100
-                        },
-                        "age": {
-                            "type": "integer",
-                            "description": "New pet age",
-                            "minimum": 0,
-                            "maximum": 30
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "New pet description",
-                            "maxLength": 500
-                        }
-                    },
-                    "required": ["pet_id"],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "integer"},
-                        "name": {"type": "string"},
-                        "species": {"type": "string"},
-                        "breed": {"type": "string"},
-                        "age": {"type": "integer"},
-                        "description": {"type": "string"},
-                        "is_adopted": {"type": "boolean"},
-                        "created_at": {"type": "string", "format": "date-time"},
-                        "updated_at": {"type": "string", "format": "date-time"}
-                    },
-                    "required": ["id", "name", "species", "is_adopted", "updated_at"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.7,
-                    "category": "modification",
-                    "requiresConfirmation": True,
-                    "sensitiveOperation": True
-                }
-            ),
-            MCPTool(
-                name="get_valid_species",
-                title="Get Valid Pet Species",
-                description="Get list of valid pet species including existing and common options",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "species": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "All valid pet species"
-                        },
-                        "existing_in_database": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Species currently in database"
-                        },
-                        "common_options": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Common pet species options"
-                        }
-                    },
-                    "required": ["species", "existing_in_database", "common_options"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.6,
-                    "category": "reference",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="get_pet_by_name",
-                title="Get Pet by Name",
-                description="Find a pet by searching for its name",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Pet name to search for",
-                            "minLength": 1
-                        }
-                    },
-                    "required": ["name"],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "integer"},
-                        "name": {"type": "string"},
-                        "species": {"type": "string"},
-                        "breed": {"type": "string"},
-                        "age": {"type": "integer"},
-                        "description": {"type": "string"},
-                        "is_adopted": {"type": "boolean"},
-                        "created_at": {"type": "string", "format": "date-time"},
-                        "updated_at": {"type": "string", "format": "date-time"}
-                    },
-                    "required": ["id", "name", "species", "is_adopted"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.8,
-                    "category": "search",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="get_pet_by_id",
-                title="Get Pet by ID",
-                description="Get a specific pet by its ID",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pet_id": {
-                            "type": "integer",
-                            "description": "Pet ID to retrieve",
-                            "minimum": 1
-                        }
-                    },
-                    "required": ["pet_id"],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "id": {"type": "integer"},
-                        "name": {"type": "string"},
-                        "species": {"type": "string"},
-                        "breed": {"type": "string"},
-                        "age": {"type": "integer"},
-                        "description": {"type": "string"},
-                        "is_adopted": {"type": "boolean"},
-                        "created_at": {"type": "string", "format": "date-time"},
-                        "updated_at": {"type": "string", "format": "date-time"}
-                    },
-                    "required": ["id", "name", "species", "is_adopted"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.8,
-                    "category": "search",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="get_available_pets",
-                title="Get Available Pets",
-                description="Get all pets that are currently available for adoption",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "array",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "id": {"type": "integer"},
-                            "name": {"type": "string"},
-                            "species": {"type": "string"},
-                            "breed": {"type": "string"},
-                            "age": {"type": "integer"},
-                            "description": {"type": "string"},
-                            "is_adopted": {"type": "boolean"},
-                            "created_at": {"type": "string", "format": "date-time"},
-                            "updated_at": {"type": "string", "format": "date-time"}
-                        },
-                        "required": ["id", "name", "species", "is_adopted"]
-                    }
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.9,
-                    "category": "search",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="get_adoption_stats",
-                title="Get Adoption Statistics",
-                description="Get overall adoption statistics including rates and counts",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "total_pets": {"type": "integer"},
-                        "adopted_pets": {"type": "integer"},
-                        "available_pets": {"type": "integer"},
-                        "adoption_rate": {"type": "number"},
-                        "species_breakdown": {
-                            "type": "object",
-                            "additionalProperties": {
-                                "type": "object",
-                                "properties": {
-                                    "total": {"type": "integer"},
-                                    "adopted": {"type": "integer"},
-                                    "available": {"type": "integer"}
-                                }
-                            }
-                        }
-                    },
-                    "required": ["total_pets", "adopted_pets", "available_pets", "adoption_rate"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.8,
-                    "category": "analytics",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="list_all_pets",
-                title="List All Pets",
-                description="Get a complete list of all pets in the system",
-                inputSchema={
-                    "type": "object",
-                    "properties": {},
-                    "required": [],
-                    "additionalProperties": False
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pets": {
-                            "type": "array",
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "id": {"type": "integer"},
-                                    "name": {"type": "string"},
-                                    "species": {"type": "string"},
-                                    "breed": {"type": "string"},
-                                    "age": {"type": "integer"},
-                                    "description": {"type": "string"},
-                                    "is_adopted": {"type": "boolean"},
-                                    "created_at": {"type": "string", "format": "date-time"},
-                                    "updated_at": {"type": "string", "format": "date-time"}
-                                },
-                                "required": ["id", "name", "species", "is_adopted"]
-                            }
-                        },
-                        "total_count": {"type": "integer"}
-                    },
-                    "required": ["pets", "total_count"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.7,
-                    "category": "search",
-                    "requiresConfirmation": False
-                }
-            ),
-            MCPTool(
-                name="delete_pet",
-                title="Delete Pet",
-                description="Remove a pet from the system by ID or name",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "pet_id": {
-                            "type": "integer",
-                            "description": "Pet ID to delete",
-                            "minimum": 1
-                        },
-                        "pet_name": {
-                            "type": "string",
-                            "description": "Pet name to delete (alternative to pet_id)",
-                            "minLength": 1
-                        }
-                    },
-                    "required": [],
-                    "additionalProperties": False,
-                    "anyOf": [
-                        {"required": ["pet_id"]},
-                        {"required": ["pet_name"]}
-                    ]
-                },
-                outputSchema={
-                    "type": "object",
-                    "properties": {
-                        "message": {"type": "string"},
-                        "deleted_pet_id": {"type": "integer"}
-                    },
-                    "required": ["message", "deleted_pet_id"]
-                },
-                annotations={
-                    "audience": ["user", "assistant"],
-                    "priority": 0.6,
-                    "category": "modification",
-                    "requiresConfirmation": True,
-                    "sensitiveOperation": True,
-                    "destructiveOperation": True
-                }
-            )
-        ]
+        return _TOOLS
 
     @staticmethod
-    def get_available_resources() -> List[MCPResource]:
+    def get_available_resources() -> Tuple[MCPResource, ...]:
         """
         Get list of all available MCP resources.
         
         Returns:
-            List of MCPResource schemas describing available resources
+            Tuple of MCPResource schemas describing available resources (shared, read-only)
         """
-        return [
-            MCPResource(
-                uri="file://adoption-form.pdf",
-                name="Pet Adoption Application Form",
-                description="Standard form for pet adoption applications",
-                mimeType="application/pdf"
-            ),
-            MCPResource(
-                uri="file://pet-care-guide.md",
-                name="Pet Care Guidelines",
-                description="Comprehensive guide for pet care and responsibilities",
-                mimeType="text/markdown"
-            ),
-            MCPResource(
-                uri="file://adoption-process.md",
-                name="Adoption Process Documentation",
-                description="Step-by-step guide to the pet adoption process",
-                mimeType="text/markdown"
-            ),
-            MCPResource(
-                uri="file://species-info.json",
-                name="Pet Species Information",
-                description="Detailed information about different pet species and their care requirements",
-                mimeType="application/json"
-            )
-        ]
+        return _RESOURCES
 
     @staticmethod
-    def get_available_prompts() -> List[MCPPrompt]:
+    def get_available_prompts() -> Tuple[MCPPrompt, ...]:
         """
         Get list of all available MCP prompts.
         
         Returns:
-            List of MCPPrompt schemas describing available prompts
+            Tuple of MCPPrompt schemas describing available prompts (shared, read-only)
         """
-        return [
-            MCPPrompt(
-                name="adoption_assistant",
-                description="AI assistant for pet adoption counseling and guidance",
-                arguments=[
-                    {"name": "pet_type", "description": "Type of pet interested in", "required": False},
-                    {"name": "experience_level", "description": "Pet owner experience level", "required": False}
-                ]
-            ),
-            MCPPrompt(
-                name="pet_care_advisor",
-                description="Provide specific care advice for adopted pets",
-                arguments=[
-                    {"name": "species", "description": "Pet species", "required": True},
-                    {"name": "age", "description": "Pet age", "required": False},
-                    {"name": "special_needs", "description": "Any special care requirements", "required": False}
-                ]
-            ),
-            MCPPrompt(
-                name="species_recommender",
-                description="Recommend suitable pet species based on lifestyle and preferences",
-                arguments=[
-                    {"name": "living_situation", "description": "Housing situation", "required": False},
-                    {"name": "time_available", "description": "Time available for pet care", "required": False},
-                    {"name": "experience", "description": "Previous pet experience", "required": False}
-                ]
-            )
-        ]
+        return _PROMPTS
 
     @staticmethod
     def get_prompt_content(name: str, arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -1024,76 +1137,10 @@ class MCPService:
         Raises:
             ValueError: If prompt name is not found
         """
-        if name == "adoption_assistant":
-            pet_type = arguments.get('pet_type', 'any pet')
-            experience = arguments.get('experience_level', 'beginner')
-            
-            return [
-                {
-                    "role": "system",
-                    "content": {
-                        "type": "text",
-                        "text": f"You are a knowledgeable and compassionate pet adoption counselor. Help the user find the perfect {pet_type} companion based on their {experience} experience level. Provide personalized advice about pet care, responsibilities, and what to expect during the adoption process."
-                    }
-                },
-                {
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I'm interested in adopting {pet_type} and I consider myself a {experience} pet owner. Can you help guide me through the adoption process and what I should consider?"
-                    }
-                }
-            ]
-            
-        elif name == "pet_care_advisor":
-            species = arguments.get('species', 'pet')
-            age = arguments.get('age')
-            special_needs = arguments.get('special_needs')
-            
-            age_info = f" that is {age} years old" if age else ""
-            special_info = f" with special needs: {special_needs}" if special_needs else ""
-            
-            return [
-                {
-                    "role": "system", 
-                    "content": {
-                        "type": "text",
-                        "text": f"You are an expert veterinarian and pet care specialist. Provide detailed, practical advice for caring for a {species}{age_info}{special_info}. Include information about feeding, exercise, health care, grooming, and any species-specific needs."
-                    }
-                },
-                {
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I just adopted a {species}{age_info}{special_info}. What specific care advice do you have for me to ensure my new pet is healthy and happy?"
-                    }
-                }
-            ]
-            
-        elif name == "species_recommender":
-            living_situation = arguments.get('living_situation', 'not specified')
-            time_available = arguments.get('time_available', 'moderate')
-            experience = arguments.get('experience', 'some')
-            
-            return [
-                {
-                    "role": "system",
-                    "content": {
-                        "type": "text", 
-                        "text": "You are a pet adoption specialist who helps match people with the most suitable pet species based on their lifestyle, living situation, and experience. Consider factors like space requirements, time commitment, maintenance needs, and compatibility."
-                    }
-                },
-                {
-                    "role": "user",
-                    "content": {
-                        "type": "text",
-                        "text": f"I live in a {living_situation} and have {time_available} time available for pet care. I have {experience} experience with pets. What species would you recommend for me and why?"
-                    }
-                }
-            ]
-            
-        else:
+        builder = _PROMPT_BUILDERS.get(name)
+        if builder is None:
             raise ValueError(f"Unknown prompt: {name}")
+        return builder(arguments)
 
     @staticmethod
     def format_tool_result(result: Any, is_error: bool = False, content_type: str = "text") -> List[MCPContent]:
@@ -1112,6 +1159,9 @@ class MCPService:
         import json
         import base64
         
+        # Text content is built from trusted strings, so it skips validation via
+        # model_construct; image/audio/resource payloads are still validated.
+        
         # Base annotations for all content
         base_annotations = {
             "audience": ["user", "assistant"],
@@ -1120,7 +1170,7 @@ class MCPService:
         }
         
         if is_error:
-            return [MCPContent(
+            return [MCPContent.model_construct(
                 type="text",
                 text=f"Error: {str(result)}",
                 annotations={
@@ -1132,7 +1182,7 @@ class MCPService:
         
         # Handle different content types
         if content_type == "text":
-            return [MCPContent(
+            return [MCPContent.model_construct(
                 type="text", 
                 text=json.dumps(result, indent=2, ensure_ascii=False),
                 annotations=base_annotations
@@ -1149,7 +1199,7 @@ class MCPService:
                 )]
             else:
                 # Fallback to text if no image data
-                return [MCPContent(
+                return [MCPContent.model_construct(
                     type="text",
                     text=json.dumps(result, indent=2, ensure_ascii=False),
                     annotations=base_annotations
@@ -1166,7 +1216,7 @@ class MCPService:
                 )]
             else:
                 # Fallback to text if no audio data
-                return [MCPContent(
+                return [MCPContent.model_construct(
                     type="text",
                     text=json.dumps(result, indent=2, ensure_ascii=False),
                     annotations=base_annotations
@@ -1184,7 +1234,7 @@ class MCPService:
                 )]
             else:
                 # Fallback to text if no URI
-                return [MCPContent(
+                return [MCPContent.model_construct(
                     type="text",
                     text=json.dumps(result, indent=2, ensure_ascii=False),
                     annotations=base_annotations
@@ -1203,7 +1253,7 @@ class MCPService:
                 )]
             else:
                 # Fallback to text if no URI
-                return [MCPContent(
+                return [MCPContent.model_construct(
                     type="text",
                     text=json.dumps(result, indent=2, ensure_ascii=False),
                     annotations=base_annotations
@@ -1211,7 +1261,7 @@ class MCPService:
         
         else:
             # Default to text content
-            return [MCPContent(
+            return [MCPContent.model_construct(
                 type="text", 
                 text=json.dumps(result, indent=2, ensure_ascii=False),
                 annotations=base_annotations
@@ -4,110 +4,212 @@ Pytest configuration and shared fixtures for FastAPI Pet Adoption API tests
 This module provides common fixtures and configuration for all test modules.
 """
 
-import pytest
 import asyncio
-import tempfile
+import json
 import os
-from typing import AsyncGenerator, Generator
+import pytest
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Awaitable, Callable, Generator, List
+from fastapi import Request
 from fastapi.testclient import TestClient
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+# The app's own engine (used by the lifespan's init_db) must not share a file
+# between pytest-xdist workers, so keep it in memory like the test engine
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
 
 # Import our FastAPI app and components
 from main import app
 from database import Base, get_db
 from models import Pet
+from routers.mcp import mcp_server
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run every async test and fixture on uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture(scope="session")
 async def test_engine():
-    """Create a test database engine for the session."""
-    # Use temporary file for SQLite
-    temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
-    temp_db.close()
+    """Create an in-memory test database engine for the session."""
+    # StaticPool keeps a single connection, so every session sees the same in-memory DB
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
     
-    database_url = f"sqlite+aiosqlite:///{temp_db.name}"
-    engine = create_async_engine(database_url, echo=False)
+    # Throwaway test data: skip journaling and syncing on every commit
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.close()
+        # Let SQLAlchemy emit BEGIN itself (below); the driver's implicit
+        # transactions would otherwise turn SAVEPOINT/RELEASE into real commits
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _sqlite_begin(conn):
+        conn.exec_driver_sql("BEGIN")
     
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    yield engine, temp_db.name
+    yield engine
     
     # Cleanup
     await engine.dispose()
-    try:
-        os.unlink(temp_db.name)
-    except:
-        pass
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture
 async def test_db(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a fresh database session for each test."""
-    engine, temp_db_path = test_engine
-    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    
-    async with async_session() as session:
-        # Clear existing data
-        await session.execute("DELETE FROM pet")
-        await session.commit()
-        yield session
+    """Create a session inside a per-test transaction that is rolled back afterwards."""
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        # commit() inside the app only releases a SAVEPOINT; the outer
+        # transaction is rolled back at teardown, so nothing persists
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
 
 
-@pytest.fixture(scope="function")
-def client(test_db) -> Generator[TestClient, None, None]:
-    """Create a test client with database dependency override."""
-    def override_get_db():
-        return test_db
+def _mark_flushed(session, flush_context) -> None:
+    session.info["flushed"] = True
+
+
+def _clear_flushed(session) -> None:
+    session.info["flushed"] = False
+
+
+@pytest.fixture(autouse=True)
+def override_db(test_db):
+    """Give every request its own session on this test's connection, with get_db's commit/rollback."""
+    conn = test_db.bind
+    
+    # Requests join the test's transaction without a SAVEPOINT: SQLite savepoints
+    # form one stack per connection, so overlapping requests would release each
+    # other's. commit() therefore only flushes, and rollback() ends the test's
+    # transaction, so a failed request that wrote nothing skips it
+    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="rollback_only"
+        ) as session:
+            event.listen(session.sync_session, "after_flush", _mark_flushed)
+            event.listen(session.sync_session, "after_commit", _clear_flushed)
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                if session.new or session.dirty or session.deleted or session.info.get("flushed"):
+                    await session.rollback()
+                raise
+            finally:
+                # Any rollback reaching the test's transaction would let later
+                # requests commit for real, so stop the test here instead
+                assert conn.in_transaction(), "a request rolled back the test's transaction"
     
     app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture
+def query_counter(test_engine) -> Generator[List[str], None, None]:
+    """Record the SELECT/INSERT/UPDATE/DELETE statements the test engine runs during a test."""
+    statements: List[str] = []
     
-    with TestClient(app) as test_client:
-        yield test_client
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        # Transaction control (BEGIN, SAVEPOINT, RELEASE) isn't a query
+        if statement.lstrip()[:6].upper() in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+            statements.append(statement)
     
-    app.dependency_overrides.clear()
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
 
 
 @pytest.fixture(scope="function")
-async def async_client(test_db) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client."""
-    def override_get_db():
-        return test_db
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+def client() -> Generator[TestClient, None, None]:
+    """Create a test client."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one async test client whose connection pool is reused by every test."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
+
+
+@pytest.fixture(scope="session")
+def mcp_call() -> Callable[[Any], Awaitable[Response]]:
+    """Call the MCP JSON-RPC endpoint function in-process, without httpx or ASGI routing.
+    
+    Returns an httpx Response so tests read status_code and json() exactly as
+    they would from async_client.
+    """
+    async def call(payload: Any) -> Response:
+        body = json.dumps(payload).encode()
+        
+        async def receive():
+            return {"type": "http.request", "body": body, "more_body": False}
+        
+        request = Request(
+            {"type": "http", "method": "POST", "path": "/api/v1/mcp/", "headers": []},
+            receive
+        )
+        # Same session lifecycle (commit/rollback) the app would get via get_db
+        async with asynccontextmanager(app.dependency_overrides[get_db])() as db:
+            response = await mcp_server(request, db)
+        return Response(response.status_code, content=response.body)
     
-    app.dependency_overrides.clear()
+    return call
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pet_data():
-    """Sample pet data for testing."""
-    return {
+    """Sample pet data for testing (read-only; use dict(...) for a mutable copy)."""
+    return MappingProxyType({
         "name": "Buddy",
         "species": "Dog",
         "breed": "Golden Retriever",
         "age": 3,
         "description": "Friendly and energetic dog"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pets_data():
-    """Sample multiple pets data for testing."""
-    return [
+    """Sample multiple pets data for testing (read-only; use dict(...) per pet to mutate)."""
+    return tuple(MappingProxyType(pet) for pet in [
         {
             "name": "Buddy",
             "species": "Dog",
@@ -129,22 +231,31 @@ def sample_pets_data():
             "age": 1,
             "description": "Singing bird"
         }
-    ]
+    ])
 
 
 @pytest.fixture
+async def seeded_pets(test_db, sample_pets_data) -> List[Pet]:
+    """Insert sample_pets_data directly in one commit; rolled back with the test's transaction."""
+    pets = [Pet(**pet) for pet in sample_pets_data]
+    test_db.add_all(pets)
+    await test_db.commit()
+    return pets
+
+
+@pytest.fixture(scope="session")
 def mcp_request_template():
     """Template for MCP JSON-RPC requests."""
-    return {
+    return MappingProxyType({
         "jsonrpc": "2.0",
         "id": "test-request"
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mcp_initialize_request(mcp_request_template):
     """MCP initialize request for testing."""
-    return {
+    return MappingProxyType({
         **mcp_request_template,
         "method": "initialize",
         "params": {
@@ -155,32 +266,17 @@ def mcp_initialize_request(mcp_request_template):
                 "version": "1.0.0"
             }
         }
-    }
+    })
 
 
-@pytest.fixture
-def mcp_tools_list_request(mcp_request_template):
-    """MCP tools/list request for testing."""
-    return {
-        **mcp_request_template,
-        "method": "tools/list"
-    }
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mcp_tool_call_request(mcp_request_template):
     """MCP tools/call request template for testing."""
-    return {
+    return MappingProxyType({
         **mcp_request_template,
         "method": "tools/call",
         "params": {
             "name": "get_pets_summary",
             "arguments": {}
         }
-    }
-
-
-# Pytest markers for test categorization
-pytestmark = [
-    pytest.mark.asyncio,
-]
+    })
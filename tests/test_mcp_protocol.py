@@ -4,10 +4,163 @@ MCP (Model Context Protocol) tests for FastAPI Pet Adoption API
 Comprehensive tests for MCP JSON-RPC 2.0 protocol implementation.
 """
 
+import asyncio
+import itertools
 import pytest
-import json
+from types import MappingProxyType
 from fastapi import status
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
+
+from mcp_test_helpers import VALIDATE_RPC_ERR, VALIDATE_RPC_OK, check_schema, loads
+from routers.mcp import MAX_BATCH_SIZE
+
+
+def _decode(response: Response):
+    """Parse a response body with the fastest available JSON codec."""
+    return loads(response.content)
+
+
+def _tool_payload(data):
+    """Parse the JSON text of a tools/call result's first content item."""
+    return loads(data["result"]["content"][0]["text"])
+
+
+# Integer JSON-RPC ids, unique across the module
+_REQUEST_IDS = itertools.count(1)
+
+# Shared JSON-RPC envelope; tests spread it and add their own params and id
+_TOOLS_CALL = MappingProxyType({"jsonrpc": "2.0", "method": "tools/call"})
+
+# Names every list endpoint must report (subset checks, so extra entries are fine)
+_EXPECTED_TOOLS = frozenset({
+    "get_pets_summary", "search_pets", "create_pet",
+    "adopt_pet_by_name", "update_pet_info", "get_valid_species"
+})
+_EXPECTED_RESOURCES = frozenset({
+    "Pet Adoption Application Form",
+    "Pet Care Guidelines",
+    "Adoption Process Documentation",
+    "Pet Species Information"
+})
+_EXPECTED_PROMPTS = frozenset({
+    "adoption_assistant",
+    "pet_care_advisor",
+    "species_recommender"
+})
+
+
+def _check_tools_list(data):
+    check_schema(VALIDATE_RPC_OK, data)
+    
+    result = data["result"]
+    assert "tools" in result
+    tools = result["tools"]
+    assert len(tools) >= 10
+    
+    # Check for expected tools
+    tool_names = {tool["name"] for tool in tools}
+    missing = _EXPECTED_TOOLS - tool_names
+    assert not missing, f"Missing tools: {missing}"
+
+
+def _check_resources_list(data):
+    check_schema(VALIDATE_RPC_OK, data)
+    
+    result = data["result"]
+    assert "resources" in result
+    resources = result["resources"]
+    assert len(resources) >= 4
+    
+    # Check for expected resources
+    resource_names = {resource["name"] for resource in resources}
+    missing = _EXPECTED_RESOURCES - resource_names
+    assert not missing, f"Missing resources: {missing}"
+
+
+def _check_prompts_list(data):
+    check_schema(VALIDATE_RPC_OK, data)
+    
+    result = data["result"]
+    assert "prompts" in result
+    prompts = result["prompts"]
+    assert len(prompts) >= 3
+    
+    # Check for expected prompts
+    prompt_names = {prompt["name"] for prompt in prompts}
+    missing = _EXPECTED_PROMPTS - prompt_names
+    assert not missing, f"Missing prompts: {missing}"
+
+
+def _check_logging_set_level(data):
+    check_schema(VALIDATE_RPC_OK, data)
+    
+    result = data["result"]
+    assert "message" in result
+    assert "level" in result
+    assert result["level"] == "debug"
+
+
+def _check_invalid_method(data):
+    check_schema(VALIDATE_RPC_ERR, data)
+    assert data["error"]["code"] == -32601  # Method not found
+
+
+def _check_invalid_request(data):
+    check_schema(VALIDATE_RPC_ERR, data)
+    assert data["error"]["code"] == -32600  # Invalid Request
+
+
+# (request, expected status, response check) for one-shot JSON-RPC calls
+_SIMPLE_RPC_CASES = [
+    (
+        {"jsonrpc": "2.0", "method": "tools/list", "id": next(_REQUEST_IDS)},
+        status.HTTP_200_OK,
+        _check_tools_list
+    ),
+    (
+        {"jsonrpc": "2.0", "method": "resources/list", "id": next(_REQUEST_IDS)},
+        status.HTTP_200_OK,
+        _check_resources_list
+    ),
+    (
+        {"jsonrpc": "2.0", "method": "prompts/list", "id": next(_REQUEST_IDS)},
+        status.HTTP_200_OK,
+        _check_prompts_list
+    ),
+    (
+        {
+            "jsonrpc": "2.0",
+            "method": "logging/setLevel",
+            "params": {
+                "level": "debug"
+            },
+            "id": next(_REQUEST_IDS)
+        },
+        status.HTTP_200_OK,
+        _check_logging_set_level
+    ),
+    (
+        {"jsonrpc": "2.0", "method": "invalid_method", "id": next(_REQUEST_IDS)},
+        status.HTTP_404_NOT_FOUND,
+        _check_invalid_method
+    ),
+    (
+        # Invalid version
+        {"jsonrpc": "1.0", "method": "tools/list", "id": next(_REQUEST_IDS)},
+        status.HTTP_400_BAD_REQUEST,
+        _check_invalid_request
+    ),
+    (
+        # No method
+        {"jsonrpc": "2.0", "id": next(_REQUEST_IDS)},
+        status.HTTP_400_BAD_REQUEST,
+        _check_invalid_request
+    ),
+]
+_SIMPLE_RPC_IDS = [
+    "tools_list", "resources_list", "prompts_list", "logging_setLevel",
+    "invalid_method", "invalid_jsonrpc_version", "missing_method"
+]
 
 
 @pytest.mark.mcp
@@ -21,7 +174,7 @@ class TestMCPProtocol:
         response = await async_client.get("/api/v1/mcp/info")
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
+        data = _decode(response)
         assert "server" in data
         assert "capabilities" in data
         assert data["server"]["name"] == "Pet Adoption API"
@@ -31,15 +184,14 @@ class TestMCPProtocol:
         assert "prompts" in data["capabilities"]
 
     @pytest.mark.asyncio
-    async def test_mcp_initialize(self, async_client: AsyncClient, mcp_initialize_request):
+    async def test_mcp_initialize(self, mcp_call, mcp_initialize_request):
         """Test MCP initialize method."""
-        response = await async_client.post("/api/v1/mcp/", json=mcp_initialize_request)
+        response = await mcp_call(dict(mcp_initialize_request))
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
         assert data["id"] == mcp_initialize_request["id"]
-        assert "result" in data
         
         result = data["result"]
         assert result["protocolVersion"] == "2025-06-18"
@@ -48,7 +200,7 @@ class TestMCPProtocol:
         assert result["serverInfo"]["name"] == "Pet Adoption API"
 
     @pytest.mark.asyncio
-    async def test_mcp_initialized_notification(self, async_client: AsyncClient):
+    async def test_mcp_initialized_notification(self, mcp_call):
         """Test MCP initialized notification."""
         request_data = {
             "jsonrpc": "2.0",
@@ -56,79 +208,58 @@ class TestMCPProtocol:
             "params": {}
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
 
     @pytest.mark.asyncio
-    async def test_mcp_tools_list(self, async_client: AsyncClient, mcp_tools_list_request):
-        """Test MCP tools/list method."""
-        response = await async_client.post("/api/v1/mcp/", json=mcp_tools_list_request)
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == mcp_tools_list_request["id"]
-        assert "result" in data
-        
-        result = data["result"]
-        assert "tools" in result
-        tools = result["tools"]
-        assert len(tools) >= 10
-        
-        # Check for expected tools
-        tool_names = [tool["name"] for tool in tools]
-        expected_tools = [
-            "get_pets_summary", "search_pets", "create_pet",
-            "adopt_pet_by_name", "update_pet_info", "get_valid_species"
-        ]
-        for expected_tool in expected_tools:
-            assert expected_tool in tool_names
+    @pytest.mark.parametrize("request_data,expected_status,validator", _SIMPLE_RPC_CASES, ids=_SIMPLE_RPC_IDS)
+    async def test_mcp_simple_rpc(self, mcp_call, request_data, expected_status, validator):
+        """Test single-request MCP methods that need no setup: status code plus response shape."""
+        response = await mcp_call(request_data)
+        assert response.status_code == expected_status
+        
+        data = _decode(response)
+        assert data["id"] == request_data["id"]
+        validator(data)
 
     @pytest.mark.asyncio
-    async def test_mcp_tools_call_get_pets_summary(self, async_client: AsyncClient, sample_pets_data):
+    async def test_mcp_tools_call_get_pets_summary(self, mcp_call, seeded_pets):
         """Test MCP tools/call with get_pets_summary."""
-        # Create some test data first
-        for pet_data in sample_pets_data:
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
+        req_id = next(_REQUEST_IDS)
         request_data = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
+            **_TOOLS_CALL,
             "params": {
                 "name": "get_pets_summary",
                 "arguments": {}
             },
-            "id": "test-summary"
+            "id": req_id
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-summary"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
+        assert data["id"] == req_id
         
         result = data["result"]
         assert "content" in result
         assert result["isError"] == False
         
-        # Parse the content (should be JSON string)
-        content = result["content"][0]["text"]
-        summary_data = json.loads(content)
+        # Tool results carry their payload as JSON text
+        summary_data = _tool_payload(data)
         assert "summary_by_species" in summary_data
         assert "overall_totals" in summary_data
 
     @pytest.mark.asyncio
-    async def test_mcp_tools_call_create_pet(self, async_client: AsyncClient):
+    async def test_mcp_tools_call_create_pet(self, mcp_call):
         """Test MCP tools/call with create_pet."""
+        req_id = next(_REQUEST_IDS)
         request_data = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
+            **_TOOLS_CALL,
             "params": {
                 "name": "create_pet",
                 "arguments": {
@@ -138,158 +269,111 @@ class TestMCPProtocol:
                     "age": 2
                 }
             },
-            "id": "test-create"
+            "id": req_id
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-create"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
+        assert data["id"] == req_id
         
         result = data["result"]
         assert "content" in result
         assert result["isError"] == False
         
-        # Parse the content
-        content = result["content"][0]["text"]
-        pet_data = json.loads(content)
+        # Tool results carry their payload as JSON text
+        pet_data = _tool_payload(data)
         assert pet_data["name"] == "MCP Test Pet"
         assert pet_data["species"] == "Dog"
         assert pet_data["breed"] == "Labrador"
         assert pet_data["age"] == 2
 
     @pytest.mark.asyncio
-    async def test_mcp_tools_call_search_pets(self, async_client: AsyncClient, sample_pets_data):
+    async def test_mcp_tools_call_search_pets(self, mcp_call, seeded_pets):
         """Test MCP tools/call with search_pets."""
-        # Create test data
-        for pet_data in sample_pets_data:
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
+        req_id = next(_REQUEST_IDS)
         request_data = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
+            **_TOOLS_CALL,
             "params": {
                 "name": "search_pets",
                 "arguments": {
                     "species": "Dog"
                 }
             },
-            "id": "test-search"
+            "id": req_id
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-search"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
+        assert data["id"] == req_id
         
         result = data["result"]
         assert "content" in result
         assert result["isError"] == False
         
-        # Parse the content
-        content = result["content"][0]["text"]
-        search_results = json.loads(content)
+        # Tool results carry their payload as JSON text
+        search_results = _tool_payload(data)
         assert isinstance(search_results, list)
         assert len(search_results) == 1
         assert search_results[0]["species"] == "Dog"
 
     @pytest.mark.asyncio
-    async def test_mcp_tools_call_adopt_pet_by_name(self, async_client: AsyncClient, sample_pets_data):
+    async def test_mcp_tools_call_adopt_pet_by_name(self, mcp_call, seeded_pets):
         """Test MCP tools/call with adopt_pet_by_name."""
-        # Create test data
-        for pet_data in sample_pets_data:
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
+        req_id = next(_REQUEST_IDS)
         request_data = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
+            **_TOOLS_CALL,
             "params": {
                 "name": "adopt_pet_by_name",
                 "arguments": {
                     "name": "Buddy"
                 }
             },
-            "id": "test-adopt"
+            "id": req_id
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-adopt"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
+        assert data["id"] == req_id
         
         result = data["result"]
         assert "content" in result
         assert result["isError"] == False
         
-        # Parse the content
-        content = result["content"][0]["text"]
-        adoption_result = json.loads(content)
+        # Tool results carry their payload as JSON text
+        adoption_result = _tool_payload(data)
         assert "message" in adoption_result
         assert "pet" in adoption_result
         assert "successfully adopted" in adoption_result["message"]
         assert adoption_result["pet"]["is_adopted"] == True
 
     @pytest.mark.asyncio
-    async def test_mcp_resources_list(self, async_client: AsyncClient):
-        """Test MCP resources/list method."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "method": "resources/list",
-            "id": "test-resources"
-        }
-        
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-resources"
-        assert "result" in data
-        
-        result = data["result"]
-        assert "resources" in result
-        resources = result["resources"]
-        assert len(resources) >= 4
-        
-        # Check for expected resources
-        resource_names = [resource["name"] for resource in resources]
-        expected_resources = [
-            "Pet Adoption Application Form",
-            "Pet Care Guidelines",
-            "Adoption Process Documentation",
-            "Pet Species Information"
-        ]
-        for expected_resource in expected_resources:
-            assert expected_resource in resource_names
-
-    @pytest.mark.asyncio
-    async def test_mcp_resources_read(self, async_client: AsyncClient):
+    async def test_mcp_resources_read(self, mcp_call):
         """Test MCP resources/read method."""
+        req_id = next(_REQUEST_IDS)
         request_data = {
             "jsonrpc": "2.0",
             "method": "resources/read",
             "params": {
                 "uri": "file://adoption-form.pdf"
             },
-            "id": "test-read"
+            "id": req_id
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-read"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
+        assert data["id"] == req_id
         
         result = data["result"]
         assert "contents" in result
@@ -297,40 +381,9 @@ class TestMCPProtocol:
         assert result["contents"][0]["type"] == "text"
 
     @pytest.mark.asyncio
-    async def test_mcp_prompts_list(self, async_client: AsyncClient):
-        """Test MCP prompts/list method."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "method": "prompts/list",
-            "id": "test-prompts"
-        }
-        
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
-        assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-prompts"
-        assert "result" in data
-        
-        result = data["result"]
-        assert "prompts" in result
-        prompts = result["prompts"]
-        assert len(prompts) >= 3
-        
-        # Check for expected prompts
-        prompt_names = [prompt["name"] for prompt in prompts]
-        expected_prompts = [
-            "adoption_assistant",
-            "pet_care_advisor",
-            "species_recommender"
-        ]
-        for expected_prompt in expected_prompts:
-            assert expected_prompt in prompt_names
-
-    @pytest.mark.asyncio
-    async def test_mcp_prompts_get(self, async_client: AsyncClient):
+    async def test_mcp_prompts_get(self, mcp_call):
         """Test MCP prompts/get method."""
+        req_id = next(_REQUEST_IDS)
         request_data = {
             "jsonrpc": "2.0",
             "method": "prompts/get",
@@ -341,16 +394,15 @@ class TestMCPProtocol:
                     "experience_level": "beginner"
                 }
             },
-            "id": "test-prompt"
+            "id": req_id
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-prompt"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
+        assert data["id"] == req_id
         
         result = data["result"]
         assert "description" in result
@@ -358,85 +410,96 @@ class TestMCPProtocol:
         assert len(result["messages"]) >= 2
 
     @pytest.mark.asyncio
-    async def test_mcp_logging_setLevel(self, async_client: AsyncClient):
-        """Test MCP logging/setLevel method."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "method": "logging/setLevel",
-            "params": {
-                "level": "debug"
-            },
-            "id": "test-logging"
-        }
-        
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+    async def test_mcp_batch_request(self, async_client: AsyncClient):
+        """Test MCP JSON-RPC batch returns one response per request, in order."""
+        batch = [
+            {"jsonrpc": "2.0", "method": "tools/list", "id": next(_REQUEST_IDS)},
+            {"jsonrpc": "1.0", "method": "tools/list", "id": next(_REQUEST_IDS)},
+            {"jsonrpc": "2.0", "method": "invalid_method", "id": next(_REQUEST_IDS)}
+        ]
+
+        response = await async_client.post("/api/v1/mcp/", json=batch)
         assert response.status_code == status.HTTP_200_OK
-        
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-logging"
-        assert "result" in data
-        
-        result = data["result"]
-        assert "message" in result
-        assert "level" in result
-        assert result["level"] == "debug"
+
+        data = _decode(response)
+        assert isinstance(data, list)
+        assert [item["id"] for item in data] == [message["id"] for message in batch]
+        assert "tools" in data[0]["result"]
+        assert data[1]["error"]["code"] == -32600  # Invalid Request
+        assert data[2]["error"]["code"] == -32601  # Method not found
 
     @pytest.mark.asyncio
-    async def test_mcp_invalid_method(self, async_client: AsyncClient):
-        """Test MCP with invalid method."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "method": "invalid_method",
-            "id": "test-invalid"
-        }
-        
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-        
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-invalid"
-        assert "error" in data
-        assert data["error"]["code"] == -32601  # Method not found
+    async def test_mcp_batch_omits_notifications(self, mcp_call):
+        """Test MCP JSON-RPC batch answers requests but not notifications."""
+        batch = [
+            {"jsonrpc": "2.0", "method": "tools/list", "id": next(_REQUEST_IDS)},
+            {"jsonrpc": "2.0", "method": "initialized"},
+            {"jsonrpc": "2.0", "method": "invalid_method"},
+            {"jsonrpc": "2.0", "method": "prompts/list", "id": next(_REQUEST_IDS)}
+        ]
+
+        response = await mcp_call(batch)
+        assert response.status_code == status.HTTP_200_OK
+
+        data = _decode(response)
+        assert [item["id"] for item in data] == [batch[0]["id"], batch[3]["id"]]
+        for item in data:
+            check_schema(VALIDATE_RPC_OK, item)
 
     @pytest.mark.asyncio
-    async def test_mcp_invalid_jsonrpc_version(self, async_client: AsyncClient):
-        """Test MCP with invalid JSON-RPC version."""
-        request_data = {
-            "jsonrpc": "1.0",  # Invalid version
-            "method": "tools/list",
-            "id": "test-invalid-jsonrpc"
-        }
-        
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+    async def test_mcp_batch_invalid_request_without_id(self, mcp_call):
+        """Test MCP JSON-RPC batch still answers an invalid request that has no id."""
+        response = await mcp_call([{"jsonrpc": "2.0"}])
+        assert response.status_code == status.HTTP_200_OK
+
+        data = _decode(response)
+        assert len(data) == 1
+        check_schema(VALIDATE_RPC_ERR, data[0])
+        assert data[0]["id"] is None
+        assert data[0]["error"]["code"] == -32600  # Invalid Request
+
+    @pytest.mark.asyncio
+    async def test_mcp_batch_only_notifications(self, mcp_call):
+        """Test MCP JSON-RPC batch of only notifications has no response body."""
+        response = await mcp_call([
+            {"jsonrpc": "2.0", "method": "initialized"},
+            {"jsonrpc": "2.0", "method": "logging/setLevel", "params": {"level": "info"}}
+        ])
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_mcp_batch_size_limit(self, mcp_call):
+        """Test MCP JSON-RPC batch is capped at MAX_BATCH_SIZE messages."""
+        message = {"jsonrpc": "2.0", "method": "tools/list", "id": next(_REQUEST_IDS)}
+
+        response = await mcp_call([message] * MAX_BATCH_SIZE)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(_decode(response)) == MAX_BATCH_SIZE
+
+        response = await mcp_call([message] * (MAX_BATCH_SIZE + 1))
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        
-        data = response.json()
-        assert "error" in data
+
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_ERR, data)
         assert data["error"]["code"] == -32600  # Invalid Request
 
     @pytest.mark.asyncio
-    async def test_mcp_missing_method(self, async_client: AsyncClient):
-        """Test MCP with missing method."""
-        request_data = {
-            "jsonrpc": "2.0",
-            "id": "test-missing-method"
-        }
-        
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+    async def test_mcp_empty_batch(self, mcp_call):
+        """Test MCP with an empty JSON-RPC batch."""
+        response = await mcp_call([])
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        
-        data = response.json()
-        assert "error" in data
+
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_ERR, data)
         assert data["error"]["code"] == -32600  # Invalid Request
 
     @pytest.mark.asyncio
-    async def test_mcp_tool_error_handling(self, async_client: AsyncClient):
+    async def test_mcp_tool_error_handling(self, mcp_call):
         """Test MCP tool error handling."""
+        req_id = next(_REQUEST_IDS)
         request_data = {
-            "jsonrpc": "2.0",
-            "method": "tools/call",
+            **_TOOLS_CALL,
             "params": {
                 "name": "create_pet",
                 "arguments": {
@@ -444,35 +507,53 @@ class TestMCPProtocol:
                     # Missing required species field
                 }
             },
-            "id": "test-error"
+            "id": req_id
         }
         
-        response = await async_client.post("/api/v1/mcp/", json=request_data)
+        response = await mcp_call(request_data)
         assert response.status_code == status.HTTP_200_OK
         
-        data = response.json()
-        assert data["jsonrpc"] == "2.0"
-        assert data["id"] == "test-error"
-        assert "result" in data
+        data = _decode(response)
+        check_schema(VALIDATE_RPC_OK, data)
+        assert data["id"] == req_id
         
         result = data["result"]
         assert "content" in result
         assert result["isError"] == True
         assert "Error:" in result["content"][0]["text"]
 
+    @pytest.mark.asyncio
+    async def test_mcp_batched_requests(self, async_client: AsyncClient):
+        """Test MCP with several requests sent as one JSON-RPC batch."""
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/list",
+                "id": next(_REQUEST_IDS)
+            }
+            for _ in range(5)
+        ]
+        
+        response = await async_client.post("/api/v1/mcp/", json=batch)
+        assert response.status_code == status.HTTP_200_OK
+        
+        # All should succeed, one response per request
+        data = _decode(response)
+        assert len(data) == len(batch)
+        for item in data:
+            check_schema(VALIDATE_RPC_OK, item)
+
     @pytest.mark.asyncio
     async def test_mcp_concurrent_requests(self, async_client: AsyncClient):
         """Test MCP with concurrent requests."""
-        import asyncio
-        
-        # Create multiple concurrent MCP requests
+        # Two in flight is enough to exercise parallel dispatch
         requests = [
             {
                 "jsonrpc": "2.0",
                 "method": "tools/list",
-                "id": f"concurrent-{i}"
+                "id": next(_REQUEST_IDS)
             }
-            for i in range(5)
+            for _ in range(2)
         ]
         
         tasks = [
@@ -485,6 +566,5 @@ class TestMCPProtocol:
         # All should succeed
         for response in responses:
             assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert data["jsonrpc"] == "2.0"
-            assert "result" in data
+            data = _decode(response)
+            check_schema(VALIDATE_RPC_OK, data)
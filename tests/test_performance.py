@@ -4,11 +4,73 @@ Performance and load tests for FastAPI Pet Adoption API
 Tests for performance, concurrency, and scalability.
 """
 
+import os
 import pytest
 import asyncio
 import time
 from typing import List
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from main import app
+from database import get_db
+
+
+async def seed_pets(client: AsyncClient, pets_data: List[dict]) -> List[dict]:
+    """Create pets in one request through the batch endpoint; returns the created pets."""
+    response = await client.post("/api/v1/pets/batch", json={"pets": pets_data})
+    assert response.status_code == 201, f"Seeding failed: {response.text}"
+    return response.json()["created_pets"]
+
+
+# Minimum throughput (requests/second) per check, matching the old wall-clock
+# budgets; override any of them with PERF_FLOOR_RPS_<NAME>, e.g. on slow CI
+_DEFAULT_FLOORS = {
+    "concurrent_creation": 10 / 5.0,    # 10 creates in 5s
+    "concurrent_searches": 20 / 3.0,    # 20 searches in 3s
+    "mcp_tool_calls": 15 / 4.0,         # 15 tool calls in 4s
+    "mcp_batch": 15 / 4.0,              # 15 tool calls (one JSON-RPC batch) in 4s
+    "batch_creation": 20 / 2.0,         # 20 pets (one request) in 2s
+    "query": 1 / 1.0,                   # each single query in 1s
+    "error_handling": 3 / 1.0,          # 3 error responses in 1s
+    "mixed_workload": 8 / 3.0,          # 8 mixed operations in 3s
+    "high_concurrent_reads": 50 / 5.0,  # 50 reads in 5s
+    "sustained_load": 50 / 10.0,        # more than 50 operations in 10s
+}
+PERF_FLOOR_RPS = {
+    name: float(os.environ.get(f"PERF_FLOOR_RPS_{name.upper()}", default))
+    for name, default in _DEFAULT_FLOORS.items()
+}
+
+
+def check_rps(record_property, name: str, count: int, duration: float, prop: str = "rps") -> None:
+    """Record count/duration as the test's prop property and assert it meets the floor for name."""
+    rps = count / max(duration, 1e-9)
+    record_property(prop, round(rps, 1))
+    floor = PERF_FLOOR_RPS[name]
+    assert rps >= floor, f"{name}: {rps:.1f} req/s ({count} in {duration:.2f}s), expected >= {floor:.2f}"
+
+
+@pytest.fixture(scope="module", autouse=True)
+async def warmup(test_engine, async_client: AsyncClient):
+    """Prime routing, validation and SQLAlchemy's statement cache before anything is timed."""
+    # Runs before the per-test override exists, so bind its own rolled-back session
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(bind=conn, expire_on_commit=False)
+        
+        async def warmup_get_db():
+            yield session
+        
+        app.dependency_overrides[get_db] = warmup_get_db
+        try:
+            for _ in range(5):
+                await async_client.get("/api/v1/pets/")
+                await async_client.get("/api/v1/pets/summary")
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            await session.close()
+            await trans.rollback()
 
 
 @pytest.mark.performance
@@ -17,7 +79,7 @@ class TestPerformance:
     """Performance and load test suite."""
 
     @pytest.mark.asyncio
-    async def test_concurrent_pet_creation(self, async_client: AsyncClient):
+    async def test_concurrent_pet_creation(self, async_client: AsyncClient, record_property):
         """Test concurrent pet creation performance."""
         pet_data = {
             "name": "Performance Test Pet",
@@ -28,7 +90,7 @@ class TestPerformance:
         }
         
         # Create 10 pets concurrently
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         tasks = [
             async_client.post("/api/v1/pets/", json=pet_data)
@@ -36,15 +98,14 @@ class TestPerformance:
         ]
         
         responses = await asyncio.gather(*tasks)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # All should succeed
         for response in responses:
             assert response.status_code == 201
         
-        # Performance check: should complete in reasonable time
-        duration = end_time - start_time
-        assert duration < 5.0, f"Concurrent creation took {duration:.2f}s, expected < 5s"
+        # Performance check: sustained creation rate
+        check_rps(record_property, "concurrent_creation", len(tasks), end_time - start_time)
         
         # Verify all pets were created
         response = await async_client.get("/api/v1/pets/")
@@ -52,23 +113,21 @@ class TestPerformance:
         assert len(pets) == 10
 
     @pytest.mark.asyncio
-    async def test_concurrent_search_operations(self, async_client: AsyncClient):
+    async def test_concurrent_search_operations(self, async_client: AsyncClient, record_property):
         """Test concurrent search operations performance."""
-        # Create test data
-        pet_data = {
-            "name": "Search Test Pet",
-            "species": "Cat",
-            "breed": "Test Breed",
-            "age": 2
-        }
-        
         # Create 5 pets
-        for i in range(5):
-            pet_data["name"] = f"Search Test Pet {i}"
-            await async_client.post("/api/v1/pets/", json=pet_data)
+        await seed_pets(async_client, [
+            {
+                "name": f"Search Test Pet {i}",
+                "species": "Cat",
+                "breed": "Test Breed",
+                "age": 2
+            }
+            for i in range(5)
+        ])
         
         # Perform 20 concurrent searches
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         tasks = [
             async_client.get("/api/v1/pets/search?species=Cat")
@@ -76,7 +135,7 @@ class TestPerformance:
         ]
         
         responses = await asyncio.gather(*tasks)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # All should succeed
         for response in responses:
@@ -85,11 +144,10 @@ class TestPerformance:
             assert len(pets) == 5
         
         # Performance check
-        duration = end_time - start_time
-        assert duration < 3.0, f"Concurrent searches took {duration:.2f}s, expected < 3s"
+        check_rps(record_property, "concurrent_searches", len(tasks), end_time - start_time)
 
     @pytest.mark.asyncio
-    async def test_mcp_concurrent_tool_calls(self, async_client: AsyncClient):
+    async def test_mcp_concurrent_tool_calls(self, async_client: AsyncClient, record_property):
         """Test concurrent MCP tool calls performance."""
         # Create test data
         pet_data = {
@@ -100,7 +158,7 @@ class TestPerformance:
         await async_client.post("/api/v1/pets/", json=pet_data)
         
         # Perform 15 concurrent MCP tool calls
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         tasks = [
             async_client.post("/api/v1/mcp/", json={
@@ -116,7 +174,7 @@ class TestPerformance:
         ]
         
         responses = await asyncio.gather(*tasks)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # All should succeed
         for response in responses:
@@ -126,11 +184,47 @@ class TestPerformance:
             assert "result" in data
         
         # Performance check
-        duration = end_time - start_time
-        assert duration < 4.0, f"Concurrent MCP calls took {duration:.2f}s, expected < 4s"
+        check_rps(record_property, "mcp_tool_calls", len(tasks), end_time - start_time)
+    
+    @pytest.mark.asyncio
+    async def test_mcp_jsonrpc_batch(self, async_client: AsyncClient, record_property):
+        """Test MCP dispatch throughput with the tool calls sent as one JSON-RPC batch."""
+        await async_client.post("/api/v1/pets/", json={
+            "name": "MCP Batch Pet",
+            "species": "Dog",
+            "breed": "Test Breed"
+        })
+        
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "method": "tools/call",
+                "params": {
+                    "name": "get_pets_summary",
+                    "arguments": {}
+                },
+                "id": f"perf-batch-{i}"
+            }
+            for i in range(15)
+        ]
+        
+        start_time = time.perf_counter()
+        response = await async_client.post("/api/v1/mcp/", json=batch)
+        end_time = time.perf_counter()
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == len(batch)
+        assert {item["id"] for item in data} == {request["id"] for request in batch}
+        for item in data:
+            assert item["jsonrpc"] == "2.0"
+            assert "result" in item
+        
+        # Performance check: one round-trip for the whole batch
+        check_rps(record_property, "mcp_batch", len(batch), end_time - start_time)
 
     @pytest.mark.asyncio
-    async def test_batch_operations_performance(self, async_client: AsyncClient):
+    async def test_batch_operations_performance(self, async_client: AsyncClient, record_property):
         """Test batch operations performance."""
         # Create batch data with 20 pets
         pets_data = [
@@ -145,30 +239,30 @@ class TestPerformance:
         
         batch_data = {"pets": pets_data}
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await async_client.post("/api/v1/pets/batch", json=batch_data)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         assert response.status_code == 201
         data = response.json()
         assert len(data["created_pets"]) == 20
         
-        # Performance check: batch should be faster than individual creates
-        duration = end_time - start_time
-        assert duration < 2.0, f"Batch creation took {duration:.2f}s, expected < 2s"
+        # Performance check: batch should be faster than individual creates (pets/s)
+        check_rps(record_property, "batch_creation", len(pets_data), end_time - start_time)
 
     @pytest.mark.asyncio
-    async def test_database_query_performance(self, async_client: AsyncClient):
+    async def test_database_query_performance(self, async_client: AsyncClient, record_property):
         """Test database query performance with larger datasets."""
         # Create 50 pets
-        for i in range(50):
-            pet_data = {
+        await seed_pets(async_client, [
+            {
                 "name": f"Perf Pet {i}",
                 "species": "Dog" if i % 3 == 0 else "Cat" if i % 3 == 1 else "Bird",
                 "breed": f"Breed {i % 10}",
                 "age": i % 15 + 1
             }
-            await async_client.post("/api/v1/pets/", json=pet_data)
+            for i in range(50)
+        ])
         
         # Test various query operations
         operations = [
@@ -180,14 +274,33 @@ class TestPerformance:
         ]
         
         for endpoint, description in operations:
-            start_time = time.time()
+            start_time = time.perf_counter()
             response = await async_client.get(endpoint)
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             assert response.status_code == 200, f"{description} failed"
             
-            duration = end_time - start_time
-            assert duration < 1.0, f"{description} took {duration:.2f}s, expected < 1s"
+            # One property per endpoint, so each keeps its own measurement
+            prop = "rps_" + description.lower().replace(" ", "_")
+            check_rps(record_property, "query", 1, end_time - start_time, prop)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("endpoint", ["/api/v1/pets/", "/api/v1/pets/summary"])
+    async def test_endpoint_query_count(self, async_client: AsyncClient, query_counter, endpoint):
+        """Test read endpoints run a bounded number of queries, not one per pet."""
+        await seed_pets(async_client, [
+            {
+                "name": f"Query Pet {i}",
+                "species": "Dog" if i % 3 == 0 else "Cat" if i % 3 == 1 else "Bird",
+                "age": i % 15 + 1
+            }
+            for i in range(50)
+        ])
+        query_counter.clear()
+        
+        response = await async_client.get(endpoint)
+        assert response.status_code == 200
+        assert len(query_counter) <= 3, f"{endpoint} ran {len(query_counter)} queries: {query_counter}"
 
     @pytest.mark.asyncio
     async def test_memory_usage_stability(self, async_client: AsyncClient):
@@ -195,15 +308,15 @@ class TestPerformance:
         # Create and delete pets in cycles to test memory stability
         for cycle in range(5):
             # Create 10 pets
-            pet_ids = []
-            for i in range(10):
-                pet_data = {
+            created = await seed_pets(async_client, [
+                {
                     "name": f"Memory Test Pet {cycle}-{i}",
                     "species": "Dog",
                     "breed": "Test Breed"
                 }
-                response = await async_client.post("/api/v1/pets/", json=pet_data)
-                pet_ids.append(response.json()["id"])
+                for i in range(10)
+            ])
+            pet_ids = [pet["id"] for pet in created]
             
             # Perform various operations
             await async_client.get("/api/v1/pets/")
@@ -211,15 +324,17 @@ class TestPerformance:
             await async_client.get("/api/v1/pets/search?species=Dog")
             
             # Delete all pets
-            for pet_id in pet_ids:
-                await async_client.delete(f"/api/v1/pets/{pet_id}")
+            await asyncio.gather(*(
+                async_client.delete(f"/api/v1/pets/{pet_id}")
+                for pet_id in pet_ids
+            ))
             
             # Verify cleanup
             response = await async_client.get("/api/v1/pets/")
             assert len(response.json()) == 0, f"Memory test cycle {cycle}: pets not cleaned up"
 
     @pytest.mark.asyncio
-    async def test_error_handling_performance(self, async_client: AsyncClient):
+    async def test_error_handling_performance(self, async_client: AsyncClient, record_property):
         """Test error handling doesn't impact performance."""
         # Test with various error conditions
         error_tests = [
@@ -228,38 +343,36 @@ class TestPerformance:
             ("/api/v1/mcp/", {"jsonrpc": "2.0", "method": "invalid_method", "id": "test"})
         ]
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         for endpoint, description in error_tests:
-            if isinstance(endpoint, str):
-                response = await async_client.get(endpoint)
-                assert response.status_code in [404, 200], f"{description} error handling failed"
+            # The MCP case carries its JSON-RPC payload in place of a description
+            if isinstance(description, dict):
+                response = await async_client.post(endpoint, json=description)
             else:
-                response = await async_client.post("/api/v1/mcp/", json=endpoint)
-                assert response.status_code in [404, 200], f"{description} error handling failed"
+                response = await async_client.get(endpoint)
+            assert response.status_code in [404, 200], f"{description} error handling failed"
         
-        end_time = time.time()
-        duration = end_time - start_time
+        end_time = time.perf_counter()
         
         # Error handling should be fast
-        assert duration < 1.0, f"Error handling took {duration:.2f}s, expected < 1s"
+        check_rps(record_property, "error_handling", len(error_tests), end_time - start_time)
 
     @pytest.mark.asyncio
-    async def test_mixed_workload_performance(self, async_client: AsyncClient):
+    async def test_mixed_workload_performance(self, async_client: AsyncClient, record_property):
         """Test performance with mixed workload."""
         # Create initial data
-        for i in range(10):
-            pet_data = {
+        created = await seed_pets(async_client, [
+            {
                 "name": f"Mixed Pet {i}",
                 "species": "Dog" if i % 2 == 0 else "Cat",
                 "breed": f"Breed {i}",
                 "age": i % 5 + 1
             }
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
-        # Mixed operations
-        start_time = time.time()
+            for i in range(10)
+        ])
         
+        # Mixed operations, built before the clock starts
         tasks = [
             # Read operations
             async_client.get("/api/v1/pets/"),
@@ -288,22 +401,19 @@ class TestPerformance:
             }),
             
             # Update operations
-            async_client.put("/api/v1/pets/1", json={"age": 5}) if True else None,
+            async_client.put(f"/api/v1/pets/{created[0]['id']}", json={"age": 5}),
         ]
         
-        # Filter out None values
-        tasks = [task for task in tasks if task is not None]
-        
+        start_time = time.perf_counter()
         responses = await asyncio.gather(*tasks, return_exceptions=True)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # Most should succeed (some might fail due to non-existent pets)
         success_count = sum(1 for r in responses if not isinstance(r, Exception) and r.status_code < 400)
         assert success_count >= len(tasks) * 0.8, f"Only {success_count}/{len(tasks)} operations succeeded"
         
         # Performance check
-        duration = end_time - start_time
-        assert duration < 3.0, f"Mixed workload took {duration:.2f}s, expected < 3s"
+        check_rps(record_property, "mixed_workload", len(tasks), end_time - start_time)
 
 
 @pytest.mark.performance
@@ -312,20 +422,21 @@ class TestLoadTesting:
     """Load testing for high-traffic scenarios."""
 
     @pytest.mark.asyncio
-    async def test_high_concurrent_reads(self, async_client: AsyncClient):
+    async def test_high_concurrent_reads(self, async_client: AsyncClient, record_property):
         """Test high concurrent read operations."""
         # Create test data
-        for i in range(20):
-            pet_data = {
+        await seed_pets(async_client, [
+            {
                 "name": f"Load Test Pet {i}",
                 "species": "Dog" if i % 2 == 0 else "Cat",
                 "breed": f"Breed {i % 5}",
                 "age": i % 10 + 1
             }
-            await async_client.post("/api/v1/pets/", json=pet_data)
+            for i in range(20)
+        ])
         
         # 50 concurrent read operations
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         tasks = [
             async_client.get("/api/v1/pets/")
@@ -333,7 +444,7 @@ class TestLoadTesting:
         ]
         
         responses = await asyncio.gather(*tasks)
-        end_time = time.time()
+        end_time = time.perf_counter()
         
         # All should succeed
         for response in responses:
@@ -341,36 +452,48 @@ class TestLoadTesting:
             pets = response.json()
             assert len(pets) == 20
         
-        duration = end_time - start_time
-        assert duration < 5.0, f"High concurrent reads took {duration:.2f}s, expected < 5s"
+        check_rps(record_property, "high_concurrent_reads", len(tasks), end_time - start_time)
 
     @pytest.mark.asyncio
-    async def test_sustained_load(self, async_client: AsyncClient):
+    async def test_sustained_load(self, async_client: AsyncClient, record_property):
         """Test sustained load over time."""
-        # Run operations for 30 seconds
-        start_time = time.time()
+        # Cap in-flight requests instead of sleeping between rounds; each
+        # request has its own session, so up to 10 are handled at once
+        semaphore = asyncio.Semaphore(10)
+        
+        async def bounded(request):
+            async with semaphore:
+                return await request
+        
+        # Run operations for 10 seconds
+        start_time = time.monotonic()
         operation_count = 0
+        failures = 0
         
-        while time.time() - start_time < 10:  # Reduced to 10 seconds for test speed
+        while time.monotonic() - start_time < 10:
             # Mix of operations
-            tasks = [
-                async_client.get("/api/v1/pets/"),
-                async_client.get("/api/v1/pets/summary"),
-                async_client.post("/api/v1/pets/", json={
-                    "name": f"Sustained Pet {operation_count}",
-                    "species": "Dog",
-                    "breed": "Test Breed"
-                })
-            ]
+            tasks = []
+            for _ in range(10):
+                tasks += [
+                    async_client.get("/api/v1/pets/"),
+                    async_client.get("/api/v1/pets/summary"),
+                    async_client.post("/api/v1/pets/", json={
+                        "name": f"Sustained Pet {operation_count + len(tasks)}",
+                        "species": "Dog",
+                        "breed": "Test Breed"
+                    })
+                ]
             
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
+            responses = await asyncio.gather(*(bounded(task) for task in tasks), return_exceptions=True)
             operation_count += len(tasks)
-            
-            # Brief pause to prevent overwhelming
-            await asyncio.sleep(0.1)
-        
-        # Should have completed many operations
-        assert operation_count > 50, f"Only completed {operation_count} operations in sustained load test"
+            failures += sum(
+                1 for response in responses
+                if isinstance(response, Exception) or response.status_code >= 400
+            )
+        duration = time.monotonic() - start_time
+        
+        assert failures == 0, f"{failures}/{operation_count} operations failed under sustained load"
+        check_rps(record_property, "sustained_load", operation_count, duration)
         
         # Verify system is still responsive
         response = await async_client.get("/api/v1/pets/")
@@ -4,6 +4,7 @@ Pets API endpoint tests for FastAPI Pet Adoption API
 Comprehensive tests for all pets-related REST API endpoints.
 """
 
+import asyncio
 import pytest
 from fastapi import status
 from httpx import AsyncClient
@@ -24,7 +25,7 @@ class TestPetsAPI:
     @pytest.mark.asyncio
     async def test_create_pet(self, async_client: AsyncClient, sample_pet_data):
         """Test creating a new pet."""
-        response = await async_client.post("/api/v1/pets/", json=sample_pet_data)
+        response = await async_client.post("/api/v1/pets/", json=dict(sample_pet_data))
         assert response.status_code == status.HTTP_201_CREATED
         
         data = response.json()
@@ -49,7 +50,7 @@ class TestPetsAPI:
     async def test_get_pet_by_id(self, async_client: AsyncClient, sample_pet_data):
         """Test getting a pet by ID."""
         # First create a pet
-        create_response = await async_client.post("/api/v1/pets/", json=sample_pet_data)
+        create_response = await async_client.post("/api/v1/pets/", json=dict(sample_pet_data))
         pet_id = create_response.json()["id"]
         
         # Then get it by ID
@@ -72,7 +73,7 @@ class TestPetsAPI:
     async def test_update_pet(self, async_client: AsyncClient, sample_pet_data):
         """Test updating a pet."""
         # Create a pet
-        create_response = await async_client.post("/api/v1/pets/", json=sample_pet_data)
+        create_response = await async_client.post("/api/v1/pets/", json=dict(sample_pet_data))
         pet_id = create_response.json()["id"]
         
         # Update the pet
@@ -89,7 +90,7 @@ class TestPetsAPI:
     async def test_delete_pet(self, async_client: AsyncClient, sample_pet_data):
         """Test deleting a pet."""
         # Create a pet
-        create_response = await async_client.post("/api/v1/pets/", json=sample_pet_data)
+        create_response = await async_client.post("/api/v1/pets/", json=dict(sample_pet_data))
         pet_id = create_response.json()["id"]
         
         # Delete the pet
@@ -104,7 +105,7 @@ class TestPetsAPI:
     async def test_adopt_pet_by_id(self, async_client: AsyncClient, sample_pet_data):
         """Test adopting a pet by ID."""
         # Create a pet
-        create_response = await async_client.post("/api/v1/pets/", json=sample_pet_data)
+        create_response = await async_client.post("/api/v1/pets/", json=dict(sample_pet_data))
         pet_id = create_response.json()["id"]
         
         # Adopt the pet
@@ -119,7 +120,7 @@ class TestPetsAPI:
     async def test_adopt_pet_by_name(self, async_client: AsyncClient, sample_pet_data):
         """Test adopting a pet by name."""
         # Create a pet
-        await async_client.post("/api/v1/pets/", json=sample_pet_data)
+        await async_client.post("/api/v1/pets/", json=dict(sample_pet_data))
         
         # Adopt the pet by name
         response = await async_client.put("/api/v1/pets/adopt?name=Buddy")
@@ -130,12 +131,8 @@ class TestPetsAPI:
         assert data["pet"]["is_adopted"] == True
 
     @pytest.mark.asyncio
-    async def test_search_pets(self, async_client: AsyncClient, sample_pets_data):
+    async def test_search_pets(self, async_client: AsyncClient, seeded_pets):
         """Test searching pets with filters."""
-        # Create test pets
-        for pet_data in sample_pets_data:
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
         # Search by species
         response = await async_client.get("/api/v1/pets/search?species=Dog")
         assert response.status_code == status.HTTP_200_OK
@@ -151,12 +148,8 @@ class TestPetsAPI:
         assert persians[0]["breed"] == "Persian"
 
     @pytest.mark.asyncio
-    async def test_search_pets_available_only(self, async_client: AsyncClient, sample_pets_data):
+    async def test_search_pets_available_only(self, async_client: AsyncClient, seeded_pets):
         """Test searching for available pets only."""
-        # Create test pets
-        for pet_data in sample_pets_data:
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
         # Adopt one pet
         pets = await async_client.get("/api/v1/pets/")
         pet_id = pets.json()[0]["id"]
@@ -170,12 +163,8 @@ class TestPetsAPI:
         assert all(pet["is_adopted"] == False for pet in available_pets)
 
     @pytest.mark.asyncio
-    async def test_get_pets_summary(self, async_client: AsyncClient, sample_pets_data):
+    async def test_get_pets_summary(self, async_client: AsyncClient, seeded_pets):
         """Test getting pets summary statistics."""
-        # Create test pets
-        for pet_data in sample_pets_data:
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
         # Adopt one pet
         pets = await async_client.get("/api/v1/pets/")
         pet_id = pets.json()[0]["id"]
@@ -193,12 +182,8 @@ class TestPetsAPI:
         assert data["overall_totals"]["available_pets"] == 2
 
     @pytest.mark.asyncio
-    async def test_get_available_pets(self, async_client: AsyncClient, sample_pets_data):
+    async def test_get_available_pets(self, async_client: AsyncClient, seeded_pets):
         """Test getting available pets only."""
-        # Create test pets
-        for pet_data in sample_pets_data:
-            await async_client.post("/api/v1/pets/", json=pet_data)
-        
         # Adopt one pet
         pets = await async_client.get("/api/v1/pets/")
         pet_id = pets.json()[0]["id"]
@@ -215,7 +200,7 @@ class TestPetsAPI:
     @pytest.mark.asyncio
     async def test_create_multiple_pets(self, async_client: AsyncClient, sample_pets_data):
         """Test creating multiple pets in batch."""
-        batch_data = {"pets": sample_pets_data}
+        batch_data = {"pets": [dict(pet) for pet in sample_pets_data]}
         
         response = await async_client.post("/api/v1/pets/batch", json=batch_data)
         assert response.status_code == status.HTTP_201_CREATED
@@ -259,11 +244,9 @@ class TestPetsAPI:
     @pytest.mark.asyncio
     async def test_concurrent_pet_operations(self, async_client: AsyncClient, sample_pets_data):
         """Test concurrent pet operations."""
-        import asyncio
-        
         # Create multiple pets concurrently
         tasks = [
-            async_client.post("/api/v1/pets/", json=pet_data)
+            async_client.post("/api/v1/pets/", json=dict(pet_data))
             for pet_data in sample_pets_data
         ]
         